@@ -0,0 +1,248 @@
+"""Benchmark HTMLToMarkdownConverter against the previous if/elif implementation.
+
+Usage:
+    python scripts/bench_converter.py                  # fetch a corpus from Zendesk
+    python scripts/bench_converter.py --pages 5 --save data/bench_corpus
+    python scripts/bench_converter.py --corpus data/bench_corpus --repeat 5
+
+Fails (exit 1) if any article's Markdown differs from the baseline. The
+baseline has no skip lists, so parity is checked with SKIP_TAGS/SKIP_CLASSES
+disabled; timings use the converter's defaults.
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import ZENDESK_MAX_PER_PAGE
+from scraper.zendesk_client import ZendeskClient
+from scraper.html_to_md import HTMLToMarkdownConverter
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LegacyHTMLToMarkdownConverter(HTMLParser):
+    """Pre-dispatch-table converter (if/elif chain), kept as the parity baseline."""
+    
+    def __init__(self, base_url: str = ""):
+        super().__init__()
+        self.reset()
+        self.base_url = base_url
+        self.markdown = []
+        self.current_list = []
+        self.list_stack = []
+        self.in_code = False
+        self.in_pre = False
+        self.code_buffer = []
+    
+    def handle_starttag(self, tag, attrs):
+        """Handle opening tags."""
+        attrs_dict = dict(attrs)
+        
+        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            level = int(tag[1])
+            self.markdown.append('\n' + '#' * level + ' ')
+        
+        elif tag == 'p':
+            self.markdown.append('\n')
+        
+        elif tag == 'br':
+            self.markdown.append('\n')
+        
+        elif tag in ['ul', 'ol']:
+            self.list_stack.append(tag)
+        
+        elif tag == 'li':
+            if self.list_stack:
+                indent = '  ' * (len(self.list_stack) - 1)
+                if self.list_stack[-1] == 'ul':
+                    self.markdown.append(f'\n{indent}• ')
+                else:
+                    self.markdown.append(f'\n{indent}1. ')
+        
+        elif tag == 'strong' or tag == 'b':
+            self.markdown.append('**')
+        
+        elif tag == 'em' or tag == 'i':
+            self.markdown.append('*')
+        
+        elif tag == 'code':
+            self.in_code = True
+            self.markdown.append('`')
+        
+        elif tag == 'pre':
+            self.in_pre = True
+            self.code_buffer = []
+            self.markdown.append('\n```\n')
+        
+        elif tag == 'a':
+            href = attrs_dict.get('href', '#')
+            # Convert relative URLs to absolute
+            if href and href.startswith('/'):
+                href = urljoin(self.base_url, href)
+            self.markdown.append('[')
+            self._temp_href = href
+        
+        elif tag == 'img':
+            src = attrs_dict.get('src', '')
+            alt = attrs_dict.get('alt', 'image')
+            if src and src.startswith('/'):
+                src = urljoin(self.base_url, src)
+            self.markdown.append(f'![{alt}]({src})')
+        
+        elif tag == 'blockquote':
+            self.markdown.append('\n> ')
+        
+        elif tag in ['div', 'section', 'article']:
+            # Skip wrapper divs
+            pass
+    
+    def handle_endtag(self, tag):
+        """Handle closing tags."""
+        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']:
+            self.markdown.append('\n')
+        
+        elif tag in ['ul', 'ol']:
+            if self.list_stack:
+                self.list_stack.pop()
+            self.markdown.append('\n')
+        
+        elif tag in ['strong', 'b']:
+            self.markdown.append('**')
+        
+        elif tag in ['em', 'i']:
+            self.markdown.append('*')
+        
+        elif tag == 'code':
+            self.in_code = False
+            self.markdown.append('`')
+        
+        elif tag == 'pre':
+            self.in_pre = False
+            self.markdown.append('\n```\n')
+        
+        elif tag == 'a':
+            self.markdown.append(f']({self._temp_href})')
+            self._temp_href = None
+        
+        elif tag == 'blockquote':
+            self.markdown.append('\n')
+    
+    def handle_data(self, data):
+        """Handle text content."""
+        if not data.strip():
+            # Preserve single spaces between words
+            if self.markdown and not self.markdown[-1].endswith(' '):
+                if not self.in_pre:
+                    data = ' ' if data else ''
+            else:
+                data = ''
+        
+        if self.in_pre:
+            # In code blocks, preserve whitespace
+            self.markdown.append(data)
+        else:
+            # Normal text - clean up whitespace
+            text = ' '.join(data.split())
+            self.markdown.append(text)
+    
+    def get_markdown(self):
+        """Get the final markdown text."""
+        text = ''.join(self.markdown)
+        # Clean up excessive newlines
+        text = re.sub(r'\n\n\n+', '\n\n', text)
+        text = text.strip()
+        return text
+
+
+def load_corpus(corpus_dir: str):
+    """Load (html, base_url) pairs from *.html files (first line: <!-- base_url -->)."""
+    corpus = []
+    for path in sorted(Path(corpus_dir).glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        base_url = ""
+        match = re.match(r"<!-- (\S*) -->\n", html)
+        if match:
+            base_url = match.group(1)
+            html = html[match.end():]
+        corpus.append((html, base_url))
+    return corpus
+
+
+def fetch_corpus(pages: int, save_dir: str = None):
+    """Fetch article bodies from the Help Center list endpoint, optionally saving them."""
+    client = ZendeskClient(use_cache=False)
+    corpus = []
+    next_page_url = None
+    for _ in range(pages):
+        articles, next_page_url = client.get_articles(next_page_url=next_page_url, per_page=ZENDESK_MAX_PER_PAGE)
+        corpus.extend((a.get("body") or "", a.get("html_url", "")) for a in articles)
+        if not next_page_url:
+            break
+    
+    if save_dir:
+        Path(save_dir).mkdir(parents=True, exist_ok=True)
+        for n, (html, base_url) in enumerate(corpus):
+            Path(save_dir, f"{n:05d}.html").write_text(f"<!-- {base_url} -->\n{html}", encoding="utf-8")
+        logger.info(f"Saved {len(corpus)} articles to {save_dir}")
+    return corpus
+
+
+def convert(converter_cls, html: str, base_url: str, **kwargs) -> str:
+    converter = converter_cls(base_url=base_url, **kwargs)
+    converter.feed(html)
+    return converter.get_markdown()
+
+
+def bench(converter_cls, corpus, repeat: int) -> float:
+    """Best-of-repeat seconds to convert the whole corpus."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html, base_url in corpus:
+            convert(converter_cls, html, base_url)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML -> Markdown converter")
+    parser.add_argument("--corpus", help="Directory of saved *.html articles (default: fetch from Zendesk)")
+    parser.add_argument("--pages", type=int, default=3, help="List pages to fetch when no corpus is given")
+    parser.add_argument("--save", help="Save the fetched corpus to this directory")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs (best is reported)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else fetch_corpus(args.pages, args.save)
+    if not corpus:
+        logger.error("Empty corpus")
+        return False
+    
+    mismatches = 0
+    for n, (html, base_url) in enumerate(corpus):
+        current = convert(HTMLToMarkdownConverter, html, base_url, skip_tags=(), skip_classes=())
+        if current != convert(LegacyHTMLToMarkdownConverter, html, base_url):
+            mismatches += 1
+            logger.error(f"Output differs for article #{n} ({base_url})")
+    
+    legacy = bench(LegacyHTMLToMarkdownConverter, corpus, args.repeat)
+    current = bench(HTMLToMarkdownConverter, corpus, args.repeat)
+    size_mb = sum(len(html) for html, _ in corpus) / 1e6
+    logger.info(f"Corpus: {len(corpus)} articles, {size_mb:.1f} MB of HTML")
+    logger.info(f"Legacy:  {legacy:.3f}s")
+    logger.info(f"Current: {current:.3f}s ({legacy / current:.2f}x)")
+    logger.info(f"Identical output: {len(corpus) - mismatches}/{len(corpus)}")
+    return mismatches == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
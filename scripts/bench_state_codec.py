@@ -0,0 +1,131 @@
+"""Benchmark state codecs on synthetic article states.
+
+Usage:
+    python scripts/bench_state_codec.py                      # 1k/10k/100k articles
+    python scripts/bench_state_codec.py --sizes 1000 5000 --bandwidth-mbps 20
+
+For each state size and codec, reports serialized bytes, serialize time,
+estimated upload time (bytes / --bandwidth-mbps, no network is used) and
+parse time. "legacy" is the previous format (indent=2 JSON, stdlib json).
+Codecs whose optional dependency (zstandard, msgpack) is missing are
+skipped. Fails (exit 1) if any codec does not round-trip the state.
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import state_codec
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def make_state(articles: int, seed: int = 0) -> dict:
+    """Build a state dict shaped like ArticleStore's, with realistic record fields."""
+    rng = random.Random(seed)
+    records = {}
+    for i in range(articles):
+        article_id = 360000000000 + i
+        title = " ".join(rng.choice(("How", "to", "set", "up", "OptiSigns", "player", "Pro", "screen",
+                                     "app", "playlist", "schedule", "Android", "display", "content"))
+                         for _ in range(rng.randint(3, 9)))
+        digest = hashlib.md5(str(i).encode()).hexdigest()
+        records[str(article_id)] = {
+            "title": title,
+            "slug": f"{title.lower().replace(' ', '-')}-{i}",
+            "hash": digest,
+            "canonical_hash": hashlib.md5(digest.encode()).hexdigest(),
+            "canonical_version": "1",
+            "converter_version": "2+9f2c1e0b7a64",
+            "updated_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z",
+            "edited_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z",
+            "html_url": f"https://support.optisigns.com/hc/en-us/articles/{article_id}",
+            "saved_at": "2024-06-01T12:00:00.000000",
+            "baseline_sig": sorted(rng.getrandbits(32) for _ in range(64)),
+            "file_ids": [f"file-{digest[:24]}"],
+            "uploaded_hash": digest,
+        }
+    return {
+        "last_run": "2024-06-01T12:00:00",
+        "total_articles": articles,
+        "vector_store_id": "vs_abc123",
+        "assistant_id": "asst_abc123",
+        "next_page_url": None,
+        "incremental_cursor": 1717243200,
+        "crawl_checkpoint": None,
+        "orphaned_file_ids": [],
+        "articles": records,
+    }
+
+
+def best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_codec(name: str, state: dict, repeat: int, bandwidth_mbps: float) -> dict:
+    if name == "legacy":
+        encode = lambda: json.dumps(state, indent=2).encode("utf-8")  # noqa: E731
+        decode = lambda body: json.loads(body)  # noqa: E731
+    else:
+        encode = lambda: state_codec.encode(state, name)[0]  # noqa: E731
+        decode = state_codec.decode
+
+    body = encode()
+    return {
+        "bytes": len(body),
+        "serialize": best_of(encode, repeat),
+        "upload": len(body) * 8 / (bandwidth_mbps * 1e6),
+        "parse": best_of(lambda: decode(body), repeat),
+        "round_trip": decode(body) == state,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark state serialization codecs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Article counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs (best is reported)")
+    parser.add_argument("--bandwidth-mbps", type=float, default=50.0,
+                        help="Upload bandwidth used to estimate upload time")
+    args = parser.parse_args()
+
+    codecs = ["legacy"] + [name for name in state_codec.CODECS if state_codec.is_available(name)]
+    skipped = [name for name in state_codec.CODECS if not state_codec.is_available(name)]
+    if skipped:
+        logger.info(f"Skipping codecs with missing dependencies: {', '.join(skipped)}")
+
+    success = True
+    for size in args.sizes:
+        state = make_state(size)
+        logger.info(f"\n{size} articles:")
+        logger.info(f"  {'codec':<14}{'bytes':>14}{'serialize':>12}{'upload':>10}{'parse':>10}{'total':>10}")
+        baseline = None
+        for name in codecs:
+            result = bench_codec(name, state, args.repeat, args.bandwidth_mbps)
+            total = result["serialize"] + result["upload"] + result["parse"]
+            baseline = baseline or total
+            logger.info(f"  {name:<14}{result['bytes']:>14,}{result['serialize']:>11.3f}s"
+                        f"{result['upload']:>9.3f}s{result['parse']:>9.3f}s{total:>9.3f}s"
+                        f"  ({baseline / total:.1f}x)")
+            if not result["round_trip"]:
+                logger.error(f"  {name} did not round-trip the state")
+                success = False
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
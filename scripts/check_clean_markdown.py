@@ -0,0 +1,113 @@
+"""Check that clean_markdown matches the previous multi-pass implementation.
+
+Usage:
+    python scripts/check_clean_markdown.py                          # data/articles/*.md + fuzz cases
+    python scripts/check_clean_markdown.py --html-corpus data/bench_corpus
+
+The HTML corpus is the directory format written by bench_converter.py --save;
+each article is converted with html_to_markdown before cleaning. Exits 1 on
+any mismatch. tests/test_clean_markdown.py runs the same comparison on a
+committed fixture corpus and a fuzz sample under pytest.
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import ARTICLES_DIR
+from scraper.html_to_md import html_to_markdown, clean_markdown
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def legacy_clean_markdown(markdown_text: str) -> str:
+    """Previous clean_markdown (five passes, patterns compiled per call), kept as the parity baseline."""
+    markdown_text = re.sub(r'<!--.*?-->', '', markdown_text, flags=re.DOTALL)
+    markdown_text = re.sub(r'\n\n\n+', '\n\n', markdown_text)
+    markdown_text = '\n'.join(line.rstrip() for line in markdown_text.split('\n'))
+    patterns = [
+        r'Was this article helpful\?.*?(?=\n\n|$)',
+        r'Related articles.*?(?=\n\n|$)',
+        r'Did you find it helpful\?.*?(?=\n\n|$)',
+    ]
+    for pattern in patterns:
+        markdown_text = re.sub(pattern, '', markdown_text, flags=re.IGNORECASE | re.DOTALL)
+    return markdown_text.strip()
+
+
+def fuzz_cases(count: int, seed: int = 0):
+    """Random documents built from the pieces clean_markdown treats specially."""
+    pieces = [
+        "text", "# Heading", "\n", "\n\n", "\n\n\n", " ", "\t", "\r", " ", "\x0c",
+        "<!--", "-->", "<!-- note -->", "Was this article helpful?", "was THIS article helpful? yes",
+        "Related articles", "related ARTICLES:\n• one", "Did you find it helpful?", "helpful?", "• item",
+        "Was thıs article helpful?", "Related artİcles", "Was thiſ article helpful?", "Did you find İt helpful?",
+    ]
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+def load_html_corpus(corpus_dir: str):
+    """Convert saved *.html articles (first line: <!-- base_url -->) to raw Markdown."""
+    docs = []
+    for path in sorted(Path(corpus_dir).glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        base_url = ""
+        match = re.match(r"<!-- (\S*) -->\n", html)
+        if match:
+            base_url = match.group(1)
+            html = html[match.end():]
+        docs.append(html_to_markdown(html, base_url=base_url))
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check clean_markdown against the previous implementation")
+    parser.add_argument("--articles", default=str(ARTICLES_DIR), help="Directory of *.md articles")
+    parser.add_argument("--html-corpus", help="Directory of saved *.html articles")
+    parser.add_argument("--fuzz", type=int, default=20000, help="Random documents to compare")
+    args = parser.parse_args()
+
+    docs = [path.read_text(encoding="utf-8") for path in sorted(Path(args.articles).glob("*.md"))]
+    if args.html_corpus:
+        docs.extend(load_html_corpus(args.html_corpus))
+    corpus_size = len(docs)
+    docs.extend(fuzz_cases(args.fuzz))
+
+    mismatches = 0
+    for n, doc in enumerate(docs):
+        if clean_markdown(doc) != legacy_clean_markdown(doc):
+            mismatches += 1
+            if mismatches <= 5:
+                logger.error(f"Output differs for document #{n}: {doc[:200]!r}")
+
+    if corpus_size:
+        corpus = docs[:corpus_size]
+        start = time.perf_counter()
+        for doc in corpus:
+            legacy_clean_markdown(doc)
+        legacy = time.perf_counter() - start
+        start = time.perf_counter()
+        for doc in corpus:
+            clean_markdown(doc)
+        current = time.perf_counter() - start
+        logger.info(f"Corpus: {corpus_size} documents - legacy {legacy:.3f}s, current {current:.3f}s")
+
+    logger.info(f"Identical output: {len(docs) - mismatches}/{len(docs)} "
+                f"({corpus_size} corpus, {len(docs) - corpus_size} fuzz)")
+    return mismatches == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -3,6 +3,7 @@
 import os
 import sys
 import json
+import sqlite3
 import logging
 import requests
 from pathlib import Path
@@ -15,13 +16,24 @@ load_dotenv(dotenv_path=PROJECT_ROOT / ".env")
 
 # Make src importable and pull shared config (paths, env)
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
-from config import STATE_FILE, ARTICLES_DIR, OPENAI_API_KEY  # type: ignore
+from config import (  # type: ignore
+    STATE_FILE, STATE_DB, STATE_BACKEND, ARTICLES_DIR, UPLOAD_PARTS_DIR, OPENAI_API_KEY,
+    SPACES_ENABLED, SPACES_STATE_KEY, SPACES_STATE_JOURNAL_PREFIX,
+)
+from utils.spaces import SpacesClient  # type: ignore
 
 OPENAI_BASE_URL = "https://api.openai.com/v1"
 STATE_PATH = Path(STATE_FILE)
 
 
 def load_state() -> dict:
+    if STATE_BACKEND == "sqlite" and Path(STATE_DB).exists():
+        try:
+            with sqlite3.connect(str(STATE_DB)) as conn:
+                rows = conn.execute("SELECT name, value FROM meta").fetchall()
+            return {name: json.loads(value) for name, value in rows}
+        except Exception as e:
+            logger.warning(f"Could not read state database: {e}")
     if STATE_PATH.exists():
         try:
             with open(STATE_PATH, "r", encoding="utf-8") as f:
@@ -95,7 +107,7 @@ def delete_all_files(headers: dict):
 
 def delete_articles_dir():
     if ARTICLES_DIR.exists():
-        for md_file in ARTICLES_DIR.glob("*.md"):
+        for md_file in [*ARTICLES_DIR.glob("*.md"), *ARTICLES_DIR.glob("sections/*.md")]:
             try:
                 md_file.unlink()
             except Exception as e:
@@ -103,6 +115,11 @@ def delete_articles_dir():
         logger.info(f"Cleared markdown files in {ARTICLES_DIR}")
     else:
         logger.info(f"Articles directory not found: {ARTICLES_DIR}")
+    for part_file in UPLOAD_PARTS_DIR.glob("**/*.md"):
+        try:
+            part_file.unlink()
+        except Exception as e:
+            logger.warning(f"Could not delete {part_file}: {e}")
 
 
 def reset_state_file():
@@ -112,12 +129,35 @@ def reset_state_file():
         "vector_store_id": None,
         "assistant_id": None,
         "next_page_url": None,
+        "incremental_cursor": None,
+        "crawl_checkpoint": None,
+        "orphaned_file_ids": [],
         "articles": {}
     }
     save_state(new_state)
+    # SQLite backend files and the Spaces cache ETag sidecar
+    for db_file in (Path(STATE_DB), Path(f"{STATE_DB}-wal"), Path(f"{STATE_DB}-shm"), Path(f"{STATE_PATH}.etag")):
+        if db_file.exists():
+            db_file.unlink()
     logger.info("State file reset")
 
 
+def reset_spaces_state() -> bool:
+    """Delete the Spaces state snapshot and journal, which are loaded in preference to local state."""
+    if not SPACES_ENABLED:
+        return True
+    try:
+        spaces = SpacesClient()
+        # Segments first: left behind without a snapshot they would replay from journal_seq 0
+        segments = spaces.list_keys(SPACES_STATE_JOURNAL_PREFIX)
+        spaces.delete_keys([*segments, SPACES_STATE_KEY])
+        logger.info(f"Deleted Spaces state {SPACES_STATE_KEY} and {len(segments)} journal segments")
+        return True
+    except Exception as e:
+        logger.error(f"Could not reset Spaces state: {e}")
+        return False
+
+
 def reset_all():
     api_key = OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -148,6 +188,8 @@ def reset_all():
 
     delete_articles_dir()
     reset_state_file()
+    if not reset_spaces_state():
+        return False
     logger.info("Reset complete")
     return True
 
@@ -12,10 +12,17 @@ load_dotenv(PROJECT_ROOT / ".env")
 DATA_DIR = PROJECT_ROOT / "data"
 ARTICLES_DIR = DATA_DIR / "articles"
 STATE_FILE = DATA_DIR / "state.json"
+STATE_DB = DATA_DIR / "state.db"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+CONVERSION_CACHE_DIR = DATA_DIR / "conversion_cache"
+UPLOAD_PARTS_DIR = DATA_DIR / "upload_parts"
 
 # Zendesk 
 ZENDESK_SUBDOMAIN = "support.optisigns"
 ZENDESK_API_KEY = None  # Not required for public Help Center
+ZENDESK_MAX_PER_PAGE = 100  # Largest page size the Help Center API accepts
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"  # ETag/If-Modified-Since revalidation
+HTTP_CACHE_MAX_MB = 256  # Least recently used responses are evicted above this size
 
 # OpenAI 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -30,6 +37,12 @@ SPACES_SECRET = os.getenv("SPACES_SECRET")
 SPACES_STATE_KEY = os.getenv("SPACES_STATE_KEY", "state/state.json")
 SPACES_LOG_PREFIX = os.getenv("SPACES_LOG_PREFIX", "logs/")
 SPACES_ARTIFACT_PREFIX = os.getenv("SPACES_ARTIFACT_PREFIX", "artifacts/")
+SPACES_STATE_JOURNAL = os.getenv("SPACES_STATE_JOURNAL", "true").lower() == "true"  # Save state as journal segments + snapshot
+SPACES_STATE_JOURNAL_PREFIX = f"{SPACES_STATE_KEY.rpartition('/')[0]}/journal/".lstrip("/")  # Segments live next to the snapshot
+STATE_COMPACT_EVERY = 20  # Journal segments written before they are folded into a new snapshot
+STATE_CACHE_ENABLED = os.getenv("STATE_CACHE_ENABLED", "true").lower() == "true"  # Keep state.json as an ETag-validated cache of Spaces state
+SPACES_CONDITIONAL_WRITES = os.getenv("SPACES_CONDITIONAL_WRITES", "true").lower() == "true"  # If-Match/If-None-Match on state writes
+STATE_CODEC = os.getenv("STATE_CODEC", "json-gzip")  # json | json-gzip | json-zstd | msgpack[-gzip|-zstd] (see utils.state_codec)
 
 SPACES_ENABLED = all([
 	SPACES_ENDPOINT,
@@ -48,4 +61,42 @@ SYSTEM_PROMPT = """You are OptiBot, the customer-support bot for OptiSigns.com.
 
 # Scraper settings
 MIN_ARTICLES = 30
-CHUNK_SIZE = 1024  # tokens
+CHUNK_SIZE = 1024  # tokens, vector store chunk size (static chunking strategy, 100-4096)
+CHUNK_OVERLAP = 128  # tokens shared by neighbouring chunks (at most CHUNK_SIZE / 2)
+MAX_UPLOAD_TOKENS = 8 * CHUNK_SIZE  # Larger documents are split into parts before upload
+FETCH_MAX_WORKERS = 8  # Concurrent article body fetches per page
+TRUST_LIST_PAYLOAD = True  # Use list-endpoint bodies; fetch single article only if missing/truncated
+CONVERT_WORKERS = 2  # Threads running HTML -> Markdown conversion
+PIPELINE_QUEUE_SIZE = 16  # Max articles waiting between pipeline stages
+CONVERT_PROCESSES = int(os.getenv("CONVERT_PROCESSES", os.cpu_count() or 1))  # Conversion pool size (1 = in-process)
+CONVERT_POOL_MIN_BATCH = 8  # Smaller batches are converted in-process (not worth pickling)
+CONVERT_CHUNKSIZE = 4  # Articles per task sent to a pool worker
+CONVERSION_CACHE_ENABLED = os.getenv("CONVERSION_CACHE_ENABLED", "true").lower() == "true"  # Reuse Markdown for identical HTML
+CONVERSION_CACHE_MAX_MB = 256  # Least recently used entries are evicted above this size
+SKIP_TAGS = ("script", "style", "noscript", "iframe", "nav")  # Subtrees dropped during conversion
+SKIP_CLASSES = (  # Elements with any of these classes are dropped too (Zendesk theme widgets)
+    "article-votes",
+    "article-relatives",
+    "related-articles",
+    "recent-articles",
+    "breadcrumbs",
+    "article-subscribe",
+    "article-comments",
+)
+SCRAPE_MODE = os.getenv("SCRAPE_MODE", "page")  # page (one page per run) | full (every page) | incremental | async
+ASYNC_MAX_CONCURRENCY = 64  # In-flight requests for the asyncio client (async mode)
+RATE_LIMIT_MAX_CONCURRENCY = 64  # Ceiling for the adaptive (AIMD) concurrency limit
+RATE_LIMIT_MAX_RETRIES = 5  # Retries per request throttled with 429
+RATE_LIMIT_LOW_WATERMARK = 10  # Back off when X-Rate-Limit-Remaining drops to this
+RETRY_MAX_RETRIES = 3  # Retries for timeouts, connection errors and 5xx
+RETRY_BASE_DELAY = 0.5  # seconds, doubled per retry (full jitter)
+RETRY_MAX_DELAY = 8.0  # seconds, cap on a single backoff
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failures before the breaker opens
+CIRCUIT_RESET_SECONDS = 30  # Open duration before a trial request is allowed
+FORCE_REFRESH = os.getenv("FORCE_REFRESH", "false").lower() == "true"  # Ignore updated_at short-circuit
+SIGNIFICANCE_CHECK_ENABLED = os.getenv("SIGNIFICANCE_CHECK_ENABLED", "false").lower() == "true"  # Defer trivial edits
+SIGNIFICANCE_MIN_CHANGE = 0.05  # Estimated fraction of text changed (vs last upload) that triggers an upload
+SIGNIFICANCE_MAX_STALENESS_HOURS = 72  # Deferred edits are uploaded after this long regardless
+STATE_BACKEND = os.getenv("STATE_BACKEND", "json")  # json (state.json, synced to Spaces) | sqlite (local STATE_DB)
+UPLOAD_GRANULARITY = os.getenv("UPLOAD_GRANULARITY", "article")  # article (one file each) | section (one per heading)
+SECTION_SPLIT_LEVEL = 2  # Headings up to this level (##) start a new section document
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -11,10 +12,11 @@ from typing import Dict, Any, List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scraper.scrape_articles import ArticleScraper
-from scraper.article_store import ArticleStore
+from scraper.article_store import open_article_store
 from openai_service.upload_markdown import OptiBot as OptiBotAssistant
 from utils.logger import setup_logger
 from utils.spaces_logger import setup_spaces_logging
+from config import FETCH_MAX_WORKERS, SCRAPE_MODE
 
 logger = setup_logger("OptiBot-Job")
 
@@ -25,7 +27,7 @@ class OptiBotJob:
     def __init__(self):
         """Initialize OptiBot."""
         self.start_time = datetime.now()
-        self.article_store = ArticleStore()  # Initialize article store
+        self.article_store = open_article_store()  # Initialize article store (config.STATE_BACKEND)
         self.scraper = ArticleScraper(store=self.article_store)
         
         # Setup Spaces logging (writes to local log AND S3)
@@ -39,13 +41,18 @@ class OptiBotJob:
         logger.info(f"Started at {self.start_time.isoformat()}")
         logger.info("="*60)
     
-    def scrape_articles(self, per_page: int = 30) -> Dict[str, Any]:
+    def scrape_articles(self, per_page: int = 30, max_workers: int = FETCH_MAX_WORKERS,
+                        mode: str = SCRAPE_MODE) -> Dict[str, Any]:
         """
         Scrape articles from Zendesk using pagination.
         Automatically continues from saved next_page_url.
         
         Args:
             per_page: Number of articles to fetch per batch (default 30)
+            max_workers: Maximum concurrent article body fetches
+            mode: "page" (one page per run), "full" (every page in one run)
+                "incremental" (only articles changed since the last run) or
+                "async" (every page via the asyncio client)
             
         Returns:
             Scraping summary with changed_files list
@@ -54,16 +61,48 @@ class OptiBotJob:
         logger.info("-" * 60)
         
         try:
-            summary = self.scraper.scrape_articles(per_page=per_page)
+            if mode == "incremental":
+                summary = self.scraper.scrape_incremental(max_workers=max_workers)
+            elif mode == "async":
+                summary = asyncio.run(self.scraper.scrape_articles_async())
+            else:
+                summary = self.scraper.scrape_articles(
+                    per_page=per_page,
+                    max_workers=max_workers,
+                    full_crawl=(mode == "full")
+                )
             
-            processed = summary["added"] + summary["updated"]
+            processed = len(summary["changed_files"])
             logger.info("\nScraping Phase Complete")
+            logger.info(f"   • Mode: {mode} ({summary.get('pages', 0)} pages)")
             logger.info(f"   • Total Fetched: {summary['total_fetched']}")
             logger.info(f"   • New Articles: {summary['added']}")
             logger.info(f"   • Updated Articles: {summary['updated']}")
             logger.info(f"   • Unchanged (Skipped): {summary['skipped']}")
+            logger.info(f"   • Skipped by Timestamp: {summary.get('unchanged_by_timestamp', 0)}")
+            logger.info(f"   • Cosmetic Changes Suppressed: {summary.get('canonical_suppressed', 0)}")
+            logger.info(f"   • Uploads Deferred (Minor Edits): {summary.get('deferred_uploads', 0)} "
+                        f"(stale flushed: {summary.get('stale_flushed', 0)})")
             logger.info(f"   • Errors: {summary['errors']}")
+            logger.info(f"   • Detail Fetches: {summary.get('detail_fetches', 0)}")
+            logger.info(f"   • Max Fetches In Flight: {summary.get('max_in_flight', 0)}")
+            logger.info(f"   • Converted in Pool/In-Process: {summary.get('pool_conversions', 0)}/"
+                        f"{summary.get('inline_conversions', 0)}")
+            logger.info(f"   • Conversion Cache Hits/Misses: {summary.get('conversion_cache_hits', 0)}/"
+                        f"{summary.get('conversion_cache_misses', 0)}")
+            logger.info(f"   • HTTP Cache Hits/Misses: {summary.get('http_cache_hits', 0)}/{summary.get('http_cache_misses', 0)}")
+            logger.info(f"   • Throttled (429): {summary.get('throttled', 0)} "
+                        f"(retries: {summary.get('throttle_retries', 0)}, waited: {summary.get('throttle_wait_seconds', 0)}s)")
+            logger.info(f"   • Concurrency Limit: {summary.get('concurrency_limit', 0)} "
+                        f"(range {summary.get('min_concurrency', 0)}-{summary.get('max_concurrency', 0)})")
+            logger.info(f"   • Transient Retries: {summary.get('transient_retries', 0)} "
+                        f"(circuit: {summary.get('circuit_state', 'closed')})")
+            for name, stage in summary.get("stages", {}).items():
+                logger.info(f"   • Stage {name}: {stage['utilization']:.0%} busy "
+                            f"({stage['workers']} workers, {stage['items']} items)")
             logger.info(f"   • Articles to Upload: {processed}")
+            if summary.get("aborted"):
+                logger.warning(f"   • Stopped early, progress checkpointed: {summary['aborted']}")
             
             return summary
         
@@ -115,7 +154,7 @@ class OptiBotJob:
             logger.error(f"Setup failed: {e}")
             raise
     
-    def run(self, skip_upload: bool = False, per_page: int = 30) -> bool:
+    def run(self, skip_upload: bool = False, per_page: int = 30, mode: str = SCRAPE_MODE) -> bool:
         """
         Run complete OptiBot job.
         Uses pagination automatically - continues from saved next_page_url.
@@ -123,23 +162,31 @@ class OptiBotJob:
         Args:
             skip_upload: Skip vector store upload phase
             per_page: Number of articles to fetch per batch (default 30)
+            mode: Scrape mode ("page", "full", "incremental" or "async", see config.SCRAPE_MODE)
             
         Returns:
             True if successful
         """
         try:
-            # Step 1: Scrape articles
-            scrape_summary = self.scrape_articles(per_page=per_page)
-            
-            # Step 2: Upload to vector store
-            if not skip_upload:
-                changed_files = scrape_summary.get("changed_files", [])
-                if changed_files:
-                    upload_summary = self.upload_to_vector_store(changed_files=changed_files)
+            # Setters only mark state dirty inside the batch: state is written
+            # after the scrape phase and when the run ends (or fails), not
+            # after every change
+            with self.article_store.batch():
+                # Step 1: Scrape articles
+                scrape_summary = self.scrape_articles(per_page=per_page, mode=mode)
+                # Persist scrape results before the upload phase, so a crash
+                # while uploading does not lose them
+                self.article_store.flush()
+                
+                # Step 2: Upload to vector store
+                if not skip_upload:
+                    changed_files = scrape_summary.get("changed_files", [])
+                    if changed_files:
+                        upload_summary = self.upload_to_vector_store(changed_files=changed_files)
+                    else:
+                        upload_summary = {"skipped": True}
                 else:
                     upload_summary = {"skipped": True}
-            else:
-                upload_summary = {"skipped": True}
 
             # Log summary
             elapsed = datetime.now() - self.start_time
@@ -150,7 +197,9 @@ class OptiBotJob:
                 f"Updated: {scrape_summary.get('updated', 0)}, "
                 f"Skipped: {scrape_summary.get('skipped', 0)}, "
                 f"Uploaded: {len(scrape_summary.get('changed_files', []))} files, "
+                f"Cache: {scrape_summary.get('http_cache_hits', 0)} hits/{scrape_summary.get('http_cache_misses', 0)} misses, "
                 f"Elapsed: {elapsed.total_seconds():.0f}s"
+                + (" (stopped early, checkpointed)" if scrape_summary.get("aborted") else "")
             )
             
             logger.info(summary_line)
@@ -0,0 +1,158 @@
+"""Split Markdown on structural boundaries to a token budget."""
+
+import re
+from typing import List
+
+from config import CHUNK_SIZE, CHUNK_OVERLAP
+
+# Roughly one BPE token per word (long words count per 6 characters) and per
+# punctuation mark; close to cl100k counts for prose, somewhat high for URLs,
+# and needs no tokenizer download.
+_TOKEN_RE = re.compile(r'\w{1,6}|[^\w\s]')
+_HEADING_RE = re.compile(r'#{1,6} ')
+_LIST_ITEM_RE = re.compile(r'(?:[-*+•]|\d+[.)]) ')
+_FENCE = '```'
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in a piece of text."""
+    return len(_TOKEN_RE.findall(text))
+
+
+def split_blocks(markdown: str) -> List[str]:
+    """
+    Split Markdown into structural blocks.
+
+    Blocks are headings, list items, paragraphs and whole code fences; a
+    chunk boundary is only ever placed between blocks (unless a single block
+    exceeds the budget on its own).
+
+    Args:
+        markdown: Markdown text
+
+    Returns:
+        Blocks in document order, without surrounding blank lines
+    """
+    blocks = []
+    current: List[str] = []
+    in_fence = False
+
+    def close():
+        if current:
+            blocks.append("\n".join(current).strip("\n"))
+            current.clear()
+
+    for line in markdown.split("\n"):
+        stripped = line.lstrip()
+        if in_fence:
+            current.append(line)
+            if stripped.startswith(_FENCE):
+                in_fence = False
+                close()
+            continue
+        if stripped.startswith(_FENCE):
+            close()
+            in_fence = True
+            current.append(line)
+        elif not stripped:
+            close()
+        elif _HEADING_RE.match(stripped) or _LIST_ITEM_RE.match(stripped):
+            close()
+            current.append(line)
+        else:
+            current.append(line)
+    close()
+    return [block for block in blocks if block.strip()]
+
+
+def _split_oversized(block: str, max_tokens: int) -> List[str]:
+    """
+    Split a single block that exceeds the budget by lines, then by words.
+
+    A code fence cut into pieces is closed at the end of each piece and
+    reopened, with its language tag, at the start of the next.
+    """
+    lines = block.split("\n")
+    opening = lines[0].strip() if lines[0].lstrip().startswith(_FENCE) else None
+    # Leave room for the closing and reopening fence lines a cut adds
+    reserve = estimate_tokens(opening) + estimate_tokens(_FENCE) + 2 if opening else 0
+    budget = max(max_tokens - reserve, 1)
+
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    in_fence = False
+    for line in lines:
+        is_fence = line.lstrip().startswith(_FENCE)
+        units = [line] if estimate_tokens(line) <= budget else line.split(" ")
+        for n, unit in enumerate(units, 1):
+            joiner = "\n" if n == len(units) else " "
+            tokens = estimate_tokens(unit) + 1
+            # The closing fence is covered by the reserve, so never cut right before it
+            if size and size + tokens > budget and not (in_fence and is_fence):
+                piece = "".join(current).strip()
+                if in_fence:
+                    pieces.append(f"{piece}\n{_FENCE}")
+                    current = [opening + "\n"]
+                else:
+                    pieces.append(piece)
+                    current = []
+                size = 0
+            current.append(unit + joiner)
+            size += tokens
+        if is_fence:
+            in_fence = not in_fence
+    if current:
+        pieces.append("".join(current).strip())
+    return [piece for piece in pieces if piece]
+
+
+def chunk_markdown(markdown: str, max_tokens: int = CHUNK_SIZE,
+                   overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """
+    Pack structural blocks into chunks of at most max_tokens (estimated).
+
+    A heading starts a new chunk once the current one is half full, so
+    sections stay together where the budget allows. Each chunk after the
+    first repeats trailing blocks of the previous chunk, up to overlap tokens.
+
+    Args:
+        markdown: Markdown text
+        max_tokens: Token budget per chunk
+        overlap: Token budget for context repeated from the previous chunk
+
+    Returns:
+        Chunks of Markdown
+    """
+    overlap = min(overlap, max_tokens // 2)
+    blocks = []
+    for block in split_blocks(markdown):
+        tokens = estimate_tokens(block)
+        if tokens > max_tokens - overlap:
+            blocks.extend((piece, estimate_tokens(piece)) for piece in _split_oversized(block, max_tokens - overlap))
+        else:
+            blocks.append((block, tokens))
+
+    chunks: List[List[tuple]] = []
+    current: List[tuple] = []
+    size = 0
+    fresh = False  # Current chunk holds more than the overlap carried over
+    for block, tokens in blocks:
+        heading_break = _HEADING_RE.match(block) and size > max_tokens // 2
+        if fresh and (size + tokens > max_tokens or heading_break):
+            chunks.append(current)
+            carried: List[tuple] = []
+            carried_size = 0
+            for prev in reversed(current):
+                if carried_size + prev[1] > overlap:
+                    break
+                carried.insert(0, prev)
+                carried_size += prev[1]
+            current, size, fresh = carried, carried_size, False
+        current.append((block, tokens))
+        size += tokens
+        fresh = True
+    if fresh:
+        chunks.append(current)
+
+    return ["\n\n".join(block for block, _ in chunk) for chunk in chunks]
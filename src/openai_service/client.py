@@ -5,7 +5,7 @@ import time
 import json
 import requests
 from typing import Optional, List
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, CHUNK_SIZE, CHUNK_OVERLAP
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +98,27 @@ class OpenAIVectorStoreClient:
             logger.error(f"Error creating vector store: {e}")
             raise
     
+    @staticmethod
+    def chunking_strategy(chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> dict:
+        """
+        Build the static chunking strategy sent when attaching files.
+        
+        Args:
+            chunk_size: Max tokens per chunk (the API accepts 100-4096)
+            overlap: Tokens shared by neighbouring chunks (at most half of chunk_size)
+            
+        Returns:
+            chunking_strategy request parameter
+        """
+        chunk_size = max(100, min(chunk_size, 4096))
+        return {
+            "type": "static",
+            "static": {
+                "max_chunk_size_tokens": chunk_size,
+                "chunk_overlap_tokens": max(0, min(overlap, chunk_size // 2))
+            }
+        }
+    
     def upload_files_to_vector_store(self, file_paths: List[str], vector_store_id: str) -> dict:
         """
         Upload files to vector store.
@@ -107,13 +128,14 @@ class OpenAIVectorStoreClient:
             vector_store_id: Target vector store ID
             
         Returns:
-            Summary with file IDs and status
+            Summary with file IDs (also keyed by path under "uploaded") and status
         """
         summary = {
             "total": len(file_paths),
             "successful": 0,
             "failed": 0,
             "file_ids": [],
+            "uploaded": {},
             "errors": []
         }
         
@@ -138,12 +160,13 @@ class OpenAIVectorStoreClient:
                 vs_response = requests.post(
                     f"{self.base_url}/vector_stores/{vector_store_id}/files",
                     headers=self.headers,
-                    json={"file_id": file_id}
+                    json={"file_id": file_id, "chunking_strategy": self.chunking_strategy()}
                 )
                 vs_response.raise_for_status()
                 
                 summary["successful"] += 1
                 summary["file_ids"].append(file_id)
+                summary["uploaded"][file_path] = file_id
                 logger.info(f"  [{i}/{len(file_paths)}] {file_path}")
                 
             except Exception as e:
@@ -155,6 +178,32 @@ class OpenAIVectorStoreClient:
         logger.info(f"\nUpload complete: {summary['successful']}/{summary['total']} successful")
         return summary
     
+    def delete_vector_store_file(self, file_id: str, vector_store_id: str) -> bool:
+        """
+        Detach a file from a vector store and delete the uploaded file.
+        
+        Already-deleted files (404) count as success.
+        
+        Args:
+            file_id: Uploaded file ID
+            vector_store_id: Vector store the file is attached to
+            
+        Returns:
+            True if the file is gone
+        """
+        try:
+            for url, headers in (
+                (f"{self.base_url}/vector_stores/{vector_store_id}/files/{file_id}", self.headers),
+                (f"{self.base_url}/files/{file_id}", {"Authorization": f"Bearer {self.api_key}"}),
+            ):
+                response = requests.delete(url, headers=headers)
+                if response.status_code != 404:
+                    response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"Error deleting file {file_id}: {e}")
+            return False
+    
     def wait_for_vector_store_processing(self, vector_store_id: str, max_wait: int = 300):
         """
         Wait for vector store to finish processing files.
@@ -3,7 +3,9 @@
 import logging
 from pathlib import Path
 from typing import List, Optional, Dict
+from config import MAX_UPLOAD_TOKENS, CHUNK_OVERLAP, UPLOAD_PARTS_DIR
 from .client import OpenAIVectorStoreClient
+from .chunker import estimate_tokens, chunk_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -152,13 +154,15 @@ Guidelines:
         Setup vector store and upload files (reuses existing if available).
         
         Chunking Strategy:
-        - OpenAI automatically chunks at ~800 token boundaries
-        - Markdown structure (headers, lists) is preserved
+        - Documents above MAX_UPLOAD_TOKENS are split locally on headings,
+          lists and code fences, with CHUNK_OVERLAP tokens of overlap
+        - The vector store chunks each file statically at CHUNK_SIZE tokens
         - Each markdown file includes metadata (title, URL, update date)
         
         Args:
             markdown_dir: Directory containing markdown files
-            changed_files: List of changed file slugs to upload (if None, uploads all)
+            changed_files: Changed documents to upload, as paths relative to
+                markdown_dir without ".md" (if None, uploads all)
             
         Returns:
             Summary with vector store ID and upload results
@@ -177,16 +181,19 @@ Guidelines:
                 raise FileNotFoundError(f"Directory not found: {markdown_dir}")
             
             if changed_files:
-                # Upload only changed files
-                files = [dir_path / f"{slug}.md" for slug in changed_files]
-                files = [f for f in files if f.exists()]
-                logger.info(f"\nFound {len(files)} changed files to upload")
+                # Upload only changed documents (article slugs or section paths)
+                docs = changed_files
+            elif self.article_store:
+                # Full sync of every document the store tracks
+                docs = self.article_store.list_documents()
             else:
                 # Upload all files (first run or full sync)
-                files = sorted(dir_path.glob("*.md"))
-                logger.info(f"\nFound {len(files)} markdown files")
+                docs = [f.stem for f in sorted(dir_path.glob("*.md"))]
+            
+            docs = [doc for doc in docs if (dir_path / f"{doc}.md").exists()]
+            logger.info(f"\nFound {len(docs)} {'changed ' if changed_files else ''}files to upload")
             
-            if not files:
+            if not docs:
                 logger.info("No files to upload")
                 return {
                     "vector_store_id": self.vector_store_id,
@@ -194,13 +201,29 @@ Guidelines:
                     "file_counts": None
                 }
             
-            # Upload files
-            file_paths = [str(f) for f in files]
-            result = self.upload_files(file_paths)
+            # Upload files (oversized documents as several parts)
+            upload_paths = self._prepare_upload_files(dir_path, docs)
+            result = self.upload_files(list(upload_paths))
+            upload_summary = result["upload_summary"]
+            upload_summary["split_documents"] = len(upload_paths) - len(docs)
+            
+            uploaded: Dict[str, List[str]] = {}
+            incomplete = set()
+            for path, doc in upload_paths.items():
+                file_id = upload_summary.get("uploaded", {}).get(path)
+                if file_id:
+                    uploaded.setdefault(doc, []).append(file_id)
+                else:
+                    incomplete.add(doc)
+            # A document is only recorded once every part is in the vector store
+            partial = [file_id for doc in incomplete for file_id in uploaded.pop(doc, [])]
+            for file_id in partial:
+                self.client.delete_vector_store_file(file_id, self.vector_store_id)
+            upload_summary["replaced"] = self._remove_obsolete_files(uploaded)
             
             return {
                 "vector_store_id": self.vector_store_id,
-                "upload_summary": result["upload_summary"],
+                "upload_summary": upload_summary,
                 "file_counts": result["file_counts"]
             }
         
@@ -208,6 +231,65 @@ Guidelines:
             logger.error(f"Vector store setup failed: {e}")
             raise
     
+    def _prepare_upload_files(self, dir_path: Path, docs: List[str]) -> Dict[str, str]:
+        """
+        Map documents to the files to upload, splitting oversized ones.
+        
+        Documents above MAX_UPLOAD_TOKENS (estimated) are split on
+        headings, lists and code fences into parts under UPLOAD_PARTS_DIR.
+        Each part repeats the document header (title, source URL) so it
+        stands alone in retrieval.
+        
+        Args:
+            dir_path: Directory containing the documents
+            docs: Document names (paths relative to dir_path without ".md")
+            
+        Returns:
+            Upload file path -> document name
+        """
+        upload_paths = {}
+        for doc in docs:
+            path = dir_path / f"{doc}.md"
+            text = path.read_text(encoding="utf-8")
+            if estimate_tokens(text) <= MAX_UPLOAD_TOKENS:
+                upload_paths[str(path)] = doc
+                continue
+            
+            header, sep, body = text.partition("\n---\n\n")
+            if not sep:
+                header, body = "", text
+            budget = MAX_UPLOAD_TOKENS - estimate_tokens(header) - 16
+            parts = chunk_markdown(body, max_tokens=budget, overlap=CHUNK_OVERLAP)
+            for stale in UPLOAD_PARTS_DIR.glob(f"{doc}--part*.md"):
+                stale.unlink()
+            for i, part in enumerate(parts, 1):
+                part_path = UPLOAD_PARTS_DIR / f"{doc}--part{i}.md"
+                part_path.parent.mkdir(parents=True, exist_ok=True)
+                prefix = f"{header}**Part:** {i}/{len(parts)}\n\n---\n\n" if header else ""
+                part_path.write_text(prefix + part, encoding="utf-8")
+                upload_paths[str(part_path)] = doc
+            logger.info(f"Split {doc} into {len(parts)} parts for upload")
+        return upload_paths
+    
+    def _remove_obsolete_files(self, uploaded: Dict[str, List[str]]) -> int:
+        """
+        Record new file ids and delete the vector store files they replace.
+        
+        Args:
+            uploaded: Document name -> new file ids
+            
+        Returns:
+            Number of obsolete files deleted
+        """
+        if not self.article_store:
+            return 0
+        obsolete = self.article_store.record_uploads(uploaded)
+        removed = sum(1 for file_id in obsolete
+                      if self.client.delete_vector_store_file(file_id, self.vector_store_id))
+        if obsolete:
+            logger.info(f"Removed {removed}/{len(obsolete)} replaced files from vector store")
+        return removed
+    
     def create_assistant(self) -> str:
         """
         Get or create OptiBot Assistant with Vector Store.
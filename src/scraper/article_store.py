@@ -4,13 +4,19 @@ import os
 import json
 import logging
 import hashlib
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
 from slugify import slugify
 
 import config
-from utils.spaces import SpacesClient
+from utils.spaces import SpacesClient, PreconditionFailedError
+from utils import state_codec
+
+from .canonicalize import CANONICAL_RULES_VERSION, canonical_hash as compute_canonical_hash
+from .html_to_md import CONVERTER_FINGERPRINT
+from .sections import split_sections
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +24,37 @@ logger = logging.getLogger(__name__)
 class ArticleStore:
     """Manage local article storage and state tracking."""
     
-    def __init__(self, articles_dir: str = "data/articles", state_file: str = "data/state.json", use_spaces: bool = True):
+    # Per-article keys describing what the vector store holds, kept when an article is re-saved
+    UPLOAD_TRACKING_KEYS = ("baseline_sig", "pending_sig", "pending_since", "file_ids", "uploaded_hash")
+    
+    def __init__(self, articles_dir: str = "data/articles", state_file: str = "data/state.json", use_spaces: bool = True,
+                 granularity: str = config.UPLOAD_GRANULARITY):
         """
         Initialize article store.
         
         Args:
             articles_dir: Directory to store markdown files
             state_file: JSON file to track article state (hash, updated_at)
+            granularity: "article" (one upload document per article) or "section"
+                (one per heading, written under articles_dir/sections)
         """
         self.articles_dir = Path(articles_dir)
+        self.sections_dir = self.articles_dir / "sections"
+        self.granularity = granularity
         self.state_file = Path(state_file)
         self.use_spaces = use_spaces and config.SPACES_ENABLED
         self.state_key = config.SPACES_STATE_KEY
+        self.journal_prefix = config.SPACES_STATE_JOURNAL_PREFIX
+        self.use_journal = config.SPACES_STATE_JOURNAL
+        self.codec = state_codec.resolve_codec(config.STATE_CODEC)
+        self._journal_seq = 0  # Last segment applied or written
+        self._snapshot_seq = 0  # Last segment folded into the snapshot
+        self._changed_articles: set = set()  # Changes since the last save (next segment)
+        self._changed_meta: set = set()
+        # state.json doubles as a cache of the Spaces state, validated by the ETag in state.json.etag
+        self.use_state_cache = config.STATE_CACHE_ENABLED
+        self.etag_file = self.state_file.with_name(f"{self.state_file.name}.etag")
+        self._state_etag: Optional[str] = None  # ETag of the snapshot this state is based on
         self.spaces_client: Optional[SpacesClient] = None
         if self.use_spaces:
             try:
@@ -45,6 +70,12 @@ class ArticleStore:
         
         # Load existing state
         self.state = self._load_state()
+        self._dirty = False  # State changed since the last save
+        self._batch_depth = 0  # Open batch() blocks; saves are deferred while > 0
+        
+        # Upload document name -> (article key, section key or None)
+        self._doc_index: Dict[str, tuple] = {}
+        self._build_doc_index()
     
     def _load_state(self) -> Dict[str, Any]:
         """Load article state from JSON file."""
@@ -54,6 +85,9 @@ class ArticleStore:
             "vector_store_id": None,
             "assistant_id": None,
             "next_page_url": None,
+            "incremental_cursor": None,
+            "crawl_checkpoint": None,
+            "orphaned_file_ids": [],  # Vector store files to delete on the next upload
             "articles": {}
         }
 
@@ -68,8 +102,8 @@ class ArticleStore:
 
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    loaded = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    loaded = state_codec.decode(f.read())
                     logger.info(f"Loaded state from local file (fallback)")
                     return self._backfill_state(loaded, default_state) or default_state
             except Exception as e:
@@ -78,36 +112,233 @@ class ArticleStore:
         logger.info("No existing state found, starting fresh")
         return default_state
     
+    def _mark_dirty(self):
+        """Record a state change and save it now unless a batch() is open."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Save state if it changed since the last save.
+        
+        Returns:
+            True if state was written
+        """
+        if not self._dirty:
+            return False
+        self._save_state()
+        self._dirty = False
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer state saves until the outermost batch exits.
+        
+        Setters inside the block only mark state dirty, so a whole run costs
+        one state write. State is flushed on exit even if the block raises,
+        so progress (checkpoints, saved articles) survives a failed run; a
+        flush error during an exception is logged and the original error
+        propagates.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Failed to flush state after error: {e}")
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+    
     def _save_state(self):
         """Save article state to Spaces ONLY (no local save)."""
         if self.use_spaces and self.spaces_client:
             try:
-                self.spaces_client.upload_json(self.state_key, self.state)
-                logger.info(f"Saved state to Spaces: {self.state_key}")
+                if self.use_journal and self._snapshot_seq and \
+                        self._journal_seq - self._snapshot_seq < config.STATE_COMPACT_EVERY:
+                    self._append_journal_segment()
+                else:
+                    self._write_snapshot()
+            except PreconditionFailedError as e:
+                logger.error(f"State on Spaces changed since it was loaded (concurrent writer?), not overwriting: {e}")
+                raise
             except Exception as e:
                 logger.error(f"Failed to save state to Spaces: {e}")
                 raise
+            if self.use_state_cache:
+                self._write_state_cache(self.state)
         else:
             # Fallback to local if Spaces not available (dev/testing only)
             try:
                 with open(self.state_file, 'w') as f:
-                    json.dump(self.state, f, indent=2)
+                    json.dump(self.state, f, separators=(",", ":"))
                 logger.warning(f"Saved state to local file (Spaces not enabled)")
             except Exception as e:
                 logger.error(f"Error saving state locally: {e}")
                 raise
+        self._changed_articles.clear()
+        self._changed_meta.clear()
+    
+    def _upload_state_object(self, key: str, payload: Dict[str, Any], **conditions) -> Optional[str]:
+        """Upload a snapshot or journal segment encoded with the configured codec; returns its ETag."""
+        body, content_type, content_encoding = state_codec.encode(payload, self.codec)
+        return self.spaces_client.upload_bytes(key, body, content_type=content_type,
+                                               content_encoding=content_encoding, **conditions)
+    
+    def _segment_key(self, seq: int) -> str:
+        return f"{self.journal_prefix}{seq:010d}.json"
+    
+    def _append_journal_segment(self):
+        """Write only the records and metadata changed since the last save."""
+        articles = self.state["articles"]
+        segment = {
+            "seq": self._journal_seq + 1,
+            "saved_at": datetime.now().isoformat(),
+            "meta": {name: self.state.get(name) for name in self._changed_meta},
+            "articles": {key: articles[key] for key in self._changed_articles if key in articles},
+        }
+        # A segment extends the snapshot we loaded: refuse if someone compacted
+        # in between, or already wrote this sequence number
+        if self.spaces_client.conditional_writes and \
+                self.spaces_client.head_etag(self.state_key) != self._state_etag:
+            raise PreconditionFailedError(f"{self.state_key} was replaced since it was loaded")
+        self._upload_state_object(self._segment_key(segment["seq"]), segment, if_none_match="*")
+        self._journal_seq = segment["seq"]
+        logger.info(f"Saved state journal segment {segment['seq']} to Spaces "
+                    f"({len(segment['articles'])} articles, {len(segment['meta'])} fields)")
+    
+    def _write_snapshot(self):
+        """
+        Write the full state and drop the journal segments it covers.
+        
+        The snapshot records the last folded segment (journal_seq) before any
+        segment is deleted, so a failed cleanup only leaves segments that
+        loading skips.
+        """
+        seq = self._journal_seq + 1 if self.use_journal else 0
+        # Only replace the snapshot we loaded (or create one if there was none)
+        self._state_etag = self._upload_state_object(
+            self.state_key, {**self.state, "journal_seq": seq},
+            if_match=self._state_etag, if_none_match=None if self._state_etag else "*"
+        )
+        self._journal_seq = self._snapshot_seq = seq
+        logger.info(f"Saved state to Spaces: {self.state_key}")
+        
+        if self.use_journal:
+            try:
+                stale = [key for key in self.spaces_client.list_keys(self.journal_prefix) if key <= self._segment_key(seq)]
+                if stale:
+                    self.spaces_client.delete_keys(stale)
+                    logger.info(f"Compacted {len(stale)} state journal segments")
+            except Exception as e:
+                logger.warning(f"Could not delete compacted journal segments: {e}")
 
     def _download_state_from_spaces(self) -> Optional[Dict[str, Any]]:
-        """Try to download state JSON from Spaces. Returns dict or None."""
+        """
+        Try to download state from Spaces: the snapshot plus newer journal segments.
+        
+        The snapshot is fetched with If-None-Match against the cached copy's
+        ETag; when it is unchanged the local cache is used and only journal
+        segments newer than the cache are downloaded.
+        
+        Returns:
+            State dict, or None if there is no remote state
+        """
         try:
-            text = self.spaces_client.download_text(self.state_key) if self.spaces_client else None
-            if text is None:
+            cached = self._read_state_cache() if self.use_state_cache else None
+            status, body, etag = self.spaces_client.download_bytes_if_changed(
+                self.state_key, cached[1]["etag"] if cached else None
+            )
+            if status == "error":
                 return None
-            return json.loads(text)
+            self._state_etag = etag
+            if status == "not_modified":
+                state, cache_info = cached
+                self._snapshot_seq = cache_info["snapshot_seq"]
+                self._journal_seq = cache_info["journal_seq"]
+                logger.info(f"State on Spaces unchanged (ETag {etag}), using local cache {self.state_file}")
+            else:
+                state = state_codec.decode(body) if body is not None else None
+                self._snapshot_seq = self._journal_seq = (state or {}).pop("journal_seq", 0)
+            changed = status == "ok"
+            if not self.use_journal:
+                if changed and self.use_state_cache:
+                    self._write_state_cache(state)
+                return state
+            
+            segments = [key for key in self.spaces_client.list_keys(self.journal_prefix)
+                        if key > self._segment_key(self._journal_seq)]
+            for key in segments:
+                body = self.spaces_client.download_bytes(key)
+                segment = state_codec.decode(body) if body is not None else {}
+                if state is None:
+                    state = {"articles": {}}
+                state.update(segment.get("meta", {}))
+                state.setdefault("articles", {}).update(segment.get("articles", {}))
+                self._journal_seq = max(self._journal_seq, segment.get("seq", 0))
+            if segments:
+                logger.info(f"Replayed {len(segments)} state journal segments (up to {self._journal_seq})")
+            if (changed or segments) and state is not None and self.use_state_cache:
+                self._write_state_cache(state)
+            return state
         except Exception as e:  # pragma: no cover - defensive
             logger.warning(f"Failed to download state from Spaces: {e}")
             return None
 
+    def _read_state_cache(self) -> Optional[tuple]:
+        """
+        Get the cached remote state and its ETag info, if the cache is intact.
+        
+        The sidecar records the size and mtime of state.json when it was
+        written, so a file changed by anything else is not trusted.
+        
+        Returns:
+            (state, cache info) or None
+        """
+        try:
+            if not self.etag_file.exists() or not self.state_file.exists():
+                return None
+            with open(self.etag_file, 'r') as f:
+                info = json.load(f)
+            stat = self.state_file.stat()
+            if (info.get("key") != self.state_key or not info.get("etag")
+                    or (info.get("size"), info.get("mtime_ns")) != (stat.st_size, stat.st_mtime_ns)):
+                return None
+            with open(self.state_file, 'rb') as f:
+                return state_codec.decode(f.read()), info
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable state cache: {e}")
+            return None
+    
+    def _write_state_cache(self, state: Dict[str, Any]):
+        """Write the state as synced with Spaces to state.json plus its ETag sidecar."""
+        if not self._state_etag:
+            return
+        try:
+            tmp_path = self.state_file.with_name(f"{self.state_file.name}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp_path, self.state_file)
+            stat = self.state_file.stat()
+            with open(self.etag_file, 'w') as f:
+                json.dump({
+                    "key": self.state_key,
+                    "etag": self._state_etag,
+                    "snapshot_seq": self._snapshot_seq,
+                    "journal_seq": self._journal_seq,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                }, f)
+        except Exception as e:
+            logger.warning(f"Could not update state cache: {e}")
+    
     @staticmethod
     def _backfill_state(loaded: Dict[str, Any], default_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Backfill missing keys for older state payloads."""
@@ -119,13 +350,73 @@ class ArticleStore:
             logger.warning(f"Failed to backfill state: {e}")
             return None
     
-    def save_article(self, article: Dict[str, Any], markdown_content: str) -> bool:
+    # Record and metadata access. Everything below goes through these hooks so
+    # other backends (see sqlite_store.SQLiteArticleStore) only override them.
+    
+    def _get_record(self, article_key: str) -> Optional[Dict[str, Any]]:
+        """Get an article record (mutate it, then pass it to _put_record)."""
+        return self.state["articles"].get(article_key)
+    
+    def _put_record(self, article_key: str, record: Dict[str, Any]):
+        """Store a new or modified article record."""
+        self.state["articles"][article_key] = record
+        self._changed_articles.add(article_key)
+        self._dirty = True
+    
+    def _iter_records(self):
+        """Iterate over (article key, record) pairs."""
+        return iter(self.state["articles"].items())
+    
+    def _count_records(self) -> int:
+        return len(self.state["articles"])
+    
+    def _iter_pending(self):
+        """Iterate over (article key, pending_since) for articles with a deferred upload."""
+        for article_key, record in self._iter_records():
+            if record.get("pending_since"):
+                yield article_key, record["pending_since"]
+    
+    def _get_meta(self, name: str) -> Any:
+        return self.state.get(name)
+    
+    def _set_meta(self, name: str, value: Any):
+        """Set a run-level value (cursor, ids, ...) and save unless batching."""
+        self.state[name] = value
+        self._changed_meta.add(name)
+        self._mark_dirty()
+    
+    def _orphan(self, file_ids: Optional[List[str]]):
+        """Queue vector store files for deletion on the next upload."""
+        if file_ids:
+            self.state["orphaned_file_ids"].extend(file_ids)
+            self._changed_meta.add("orphaned_file_ids")
+    
+    def _take_orphans(self) -> List[str]:
+        orphans = self.state["orphaned_file_ids"]
+        self.state["orphaned_file_ids"] = []
+        self._changed_meta.add("orphaned_file_ids")
+        return orphans
+    
+    def _on_uploaded(self, article_key: str, doc: str, file_ids: List[str]):
+        """Hook for backends that keep separate upload records."""
+    
+    def _build_doc_index(self):
+        for article_key, record in self._iter_records():
+            self._index_record(article_key, record)
+    
+    def _locate_doc(self, doc: str) -> Optional[tuple]:
+        """Get (article key, section key or None) for an upload document."""
+        return self._doc_index.get(doc)
+    
+    def save_article(self, article: Dict[str, Any], markdown_content: str,
+                     canonical_hash: Optional[str] = None) -> bool:
         """
         Save article as Markdown file and update state.
         
         Args:
             article: Article dict with id, title, updated_at, etc.
             markdown_content: Markdown formatted content
+            canonical_hash: Hash of the canonical form (computed if not provided)
             
         Returns:
             True if saved, False if error
@@ -148,15 +439,36 @@ class ArticleStore:
             
             content_hash = hashlib.md5(markdown_content.encode()).hexdigest()
             
-            self.state["articles"][str(article['id'])] = {
+            # Upload tracking (last uploaded sketch, deferred edits, file ids) survives re-saves
+            previous = self._get_record(str(article['id'])) or {}
+            upload_tracking = {key: previous[key] for key in self.UPLOAD_TRACKING_KEYS if key in previous}
+            
+            record = {
                 "title": article['title'],
                 "slug": slug,
                 "hash": content_hash,
+                "canonical_hash": canonical_hash or compute_canonical_hash(markdown_content),
+                "canonical_version": CANONICAL_RULES_VERSION,
+                "converter_version": CONVERTER_FINGERPRINT,
                 "updated_at": article['updated_at'],
+                "edited_at": article.get('edited_at'),
                 "html_url": article['html_url'],
-                "saved_at": datetime.now().isoformat()
+                "saved_at": datetime.now().isoformat(),
+                **upload_tracking
             }
             
+            if self.granularity == "section":
+                record["sections"] = self._save_sections(article, slug, markdown_content, previous)
+                # The whole-article upload (if any) is replaced by the section documents
+                self._orphan(record.pop("file_ids", None))
+                record.pop("uploaded_hash", None)
+            else:
+                self._remove_sections(previous.get("sections", {}))
+            
+            self._unindex_record(previous)
+            self._put_record(str(article['id']), record)
+            self._index_record(str(article['id']), record)
+            
             logger.info(f"Saved: {slug}.md")
             return True
         
@@ -164,62 +476,312 @@ class ArticleStore:
             logger.error(f"Error saving article {article['id']}: {e}")
             return False
     
-    def has_changed(self, article_id: int, content_hash: str) -> bool:
+    def _save_sections(self, article: Dict[str, Any], slug: str, markdown_content: str,
+                       previous: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Write one document per section and return the section records.
+        
+        Each document repeats the article title and URL so it stands alone in
+        retrieval. Unchanged sections keep their upload state and are not
+        rewritten; sections that disappeared are deleted and their vector
+        store files queued for removal.
+        """
+        self.sections_dir.mkdir(parents=True, exist_ok=True)
+        old_sections = previous.get("sections", {})
+        sections = {}
+        
+        for section in split_sections(markdown_content):
+            doc = f"sections/{slug}--{section['key']}"
+            text = (
+                f"# {article['title']}\n\n"
+                f"**Source:** [{article['html_url']}]({article['html_url']})\n"
+                f"**Section:** {section['heading'] or 'Introduction'}\n\n"
+                "---\n\n"
+                f"{section['content']}"
+            )
+            section_hash = hashlib.md5(text.encode()).hexdigest()
+            entry = {"doc": doc, "hash": section_hash}
+            
+            old = old_sections.get(section["key"], {})
+            if old.get("doc") == doc:
+                entry.update({key: old[key] for key in ("file_ids", "uploaded_hash") if key in old})
+            file_path = self.articles_dir / f"{doc}.md"
+            if old.get("doc") != doc or old.get("hash") != section_hash or not file_path.exists():
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+            sections[section["key"]] = entry
+        
+        self._remove_sections({
+            key: old for key, old in old_sections.items()
+            if key not in sections or sections[key]["doc"] != old.get("doc")
+        })
+        return sections
+    
+    def _remove_sections(self, sections: Dict[str, Dict[str, Any]]):
+        """Delete section documents locally and queue their vector store files for removal."""
+        for section in sections.values():
+            self._orphan(section.get("file_ids"))
+            try:
+                (self.articles_dir / f"{section['doc']}.md").unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _index_record(self, article_key: str, record: Dict[str, Any]):
+        if record.get("slug"):
+            self._doc_index[record["slug"]] = (article_key, None)
+        for section_key, section in record.get("sections", {}).items():
+            self._doc_index[section["doc"]] = (article_key, section_key)
+    
+    def _unindex_record(self, record: Dict[str, Any]):
+        self._doc_index.pop(record.get("slug"), None)
+        for section in record.get("sections", {}).values():
+            self._doc_index.pop(section["doc"], None)
+    
+    def upload_documents(self, article_id: int) -> List[str]:
+        """
+        Get the upload documents of an article that differ from what was last uploaded.
+        
+        Documents are paths relative to articles_dir without the .md suffix:
+        the article slug, or "sections/<slug>--<section>" in section mode.
+        
+        Args:
+            article_id: Article ID
+            
+        Returns:
+            Document names to upload
+        """
+        record = self._get_record(str(article_id))
+        if not record:
+            return []
+        if "sections" in record:
+            return [section["doc"] for section in record["sections"].values()
+                    if section.get("uploaded_hash") != section["hash"]]
+        return [record["slug"]] if record.get("slug") else []
+    
+    def list_documents(self) -> List[str]:
+        """Get every upload document for the current granularity (for a full sync)."""
+        docs = []
+        for _, record in self._iter_records():
+            if self.granularity == "section":
+                docs.extend(section["doc"] for section in record.get("sections", {}).values())
+            elif record.get("slug"):
+                docs.append(record["slug"])
+        return sorted(docs)
+    
+    def record_uploads(self, uploaded: Dict[str, List[str]]) -> List[str]:
+        """
+        Record the vector store file ids of freshly uploaded documents.
+        
+        Args:
+            uploaded: Document name -> new file ids (several when uploaded in parts)
+            
+        Returns:
+            File ids that are now obsolete (replaced versions and removed
+            sections) and should be deleted from the vector store
+        """
+        obsolete = []
+        for doc, file_ids in uploaded.items():
+            location = self._locate_doc(doc)
+            if not location:
+                continue
+            article_key, section_key = location
+            record = self._get_record(article_key)
+            target = record["sections"][section_key] if section_key else record
+            obsolete.extend(file_id for file_id in target.get("file_ids", []) if file_id not in file_ids)
+            target["file_ids"] = list(file_ids)
+            target["uploaded_hash"] = target.get("hash")
+            self._put_record(article_key, record)
+            self._on_uploaded(article_key, doc, target["file_ids"])
+        
+        obsolete.extend(self._take_orphans())
+        self._mark_dirty()
+        return obsolete
+    
+    def has_changed(self, article_id: int, content_hash: str, canonical_hash: Optional[str] = None) -> bool:
         """
         Check if article content has changed since last save.
         
+        When canonical_hash is given and the stored record was hashed under
+        the current canonical rules, the canonical hashes are compared, so
+        cosmetic edits do not count as changes.
+        
         Args:
             article_id: Article ID
             content_hash: MD5 hash of new content
+            canonical_hash: MD5 hash of the new content's canonical form
             
         Returns:
             True if article is new or has changed
         """
-        article_key = str(article_id)
-        
-        if article_key not in self.state["articles"]:
+        record = self._get_record(str(article_id))
+        if not record:
             return True  # New article
         
-        old_hash = self.state["articles"][article_key].get("hash")
+        if (canonical_hash and record.get("canonical_hash")
+                and record.get("canonical_version") == CANONICAL_RULES_VERSION):
+            return record["canonical_hash"] != canonical_hash
+        
+        old_hash = record.get("hash")
         return old_hash != content_hash
     
+    def is_up_to_date(self, article: Dict[str, Any]) -> bool:
+        """
+        Check if a listed article's timestamps match the stored record.
+        
+        A record written under another CONVERTER_FINGERPRINT (converter version
+        or skip lists) or CANONICAL_RULES_VERSION is never up to date, so
+        changing any of them re-converts every article once.
+        
+        Args:
+            article: Article dict from a list response
+            
+        Returns:
+            True if updated_at and edited_at are unchanged since last save
+            under the current converter and canonical rules
+        """
+        record = self._get_record(str(article["id"]))
+        if not record or not article.get("updated_at"):
+            return False
+        if (record.get("converter_version") != CONVERTER_FINGERPRINT
+                or record.get("canonical_version") != CANONICAL_RULES_VERSION):
+            return False
+        return (record.get("updated_at") == article.get("updated_at")
+                and record.get("edited_at") == article.get("edited_at"))
+    
+    def touch_article(self, article: Dict[str, Any], content_hash: Optional[str] = None,
+                      canonical_hash: Optional[str] = None):
+        """
+        Refresh stored timestamps (and hashes, if given) for an article whose content is unchanged.
+        
+        Called after the article was re-converted, so the record is stamped
+        with the current CONVERTER_FINGERPRINT. Recording the new raw and
+        canonical hashes means a cosmetic edit is only reported once, and
+        records from older canonical rules are re-hashed under the current ones.
+        """
+        record = self._get_record(str(article["id"]))
+        if record:
+            record["updated_at"] = article.get("updated_at", record.get("updated_at"))
+            record["edited_at"] = article.get("edited_at")
+            record["converter_version"] = CONVERTER_FINGERPRINT
+            if content_hash:
+                record["hash"] = content_hash
+            if canonical_hash:
+                record["canonical_hash"] = canonical_hash
+                record["canonical_version"] = CANONICAL_RULES_VERSION
+            self._put_record(str(article["id"]), record)
+    
+    def set_upload_baseline(self, article_id: int, signature: Optional[List[int]]):
+        """Record the sketch of the content just queued for upload and clear any deferral."""
+        record = self._get_record(str(article_id))
+        if record:
+            if signature is None:
+                record.pop("baseline_sig", None)
+            else:
+                record["baseline_sig"] = signature
+            record.pop("pending_sig", None)
+            record.pop("pending_since", None)
+            self._put_record(str(article_id), record)
+    
+    def defer_upload(self, article_id: int, signature: List[int]):
+        """Mark an article as saved locally but not yet uploaded (minor edit)."""
+        record = self._get_record(str(article_id))
+        if record:
+            record["pending_sig"] = signature
+            record.setdefault("pending_since", datetime.now().isoformat())
+            self._put_record(str(article_id), record)
+    
+    def get_stale_deferrals(self, max_age: timedelta) -> List[str]:
+        """
+        Get IDs of articles whose deferred upload is older than max_age.
+        
+        Args:
+            max_age: Longest an edit may wait for upload
+            
+        Returns:
+            Article IDs (state keys)
+        """
+        cutoff = datetime.now() - max_age
+        stale = []
+        for article_key, pending_since in self._iter_pending():
+            try:
+                if datetime.fromisoformat(pending_since) <= cutoff:
+                    stale.append(article_key)
+            except ValueError:
+                stale.append(article_key)
+        return stale
+    
     def get_article(self, article_id: int) -> Optional[Dict[str, Any]]:
         """Get stored article state."""
-        return self.state["articles"].get(str(article_id))
+        return self._get_record(str(article_id))
     
     def get_vector_store_id(self) -> Optional[str]:
         """Get stored vector store ID."""
-        return self.state.get("vector_store_id")
+        return self._get_meta("vector_store_id")
     
     def set_vector_store_id(self, vector_store_id: str):
         """Set vector store ID."""
-        self.state["vector_store_id"] = vector_store_id
-        self._save_state()
+        self._set_meta("vector_store_id", vector_store_id)
     
     def get_assistant_id(self) -> Optional[str]:
         """Get stored assistant ID."""
-        return self.state.get("assistant_id")
+        return self._get_meta("assistant_id")
     
     def set_assistant_id(self, assistant_id: str):
         """Set assistant ID."""
-        self.state["assistant_id"] = assistant_id
-        self._save_state()
+        self._set_meta("assistant_id", assistant_id)
     
     def get_next_page_url(self) -> Optional[str]:
         """Get stored next_page_url for pagination."""
-        return self.state.get("next_page_url")
+        return self._get_meta("next_page_url")
     
     def set_next_page_url(self, next_page_url: Optional[str]):
         """Set next_page_url for pagination."""
-        self.state["next_page_url"] = next_page_url
-        self._save_state()
+        self._set_meta("next_page_url", next_page_url)
+    
+    def get_incremental_cursor(self) -> Optional[int]:
+        """Get stored incremental sync cursor (unix timestamp of the newest updated_at synced)."""
+        return self._get_meta("incremental_cursor")
+    
+    def set_incremental_cursor(self, cursor: Optional[int]):
+        """Set (or clear) the incremental sync cursor."""
+        self._set_meta("incremental_cursor", cursor)
+    
+    def get_crawl_checkpoint(self) -> Optional[str]:
+        """Get page URL an interrupted full crawl should resume from."""
+        return self._get_meta("crawl_checkpoint")
+    
+    def set_crawl_checkpoint(self, page_url: Optional[str]):
+        """Set (or clear) the full-crawl resume point."""
+        if self._get_meta("crawl_checkpoint") == page_url:
+            return
+        self._set_meta("crawl_checkpoint", page_url)
     
     def finalize(self):
         """Finalize storage - update metadata and save state."""
-        self.state["last_run"] = datetime.now().isoformat()
-        self.state["total_articles"] = len(self.state["articles"])
-        self._save_state()
+        total = self._count_records()
+        with self.batch():
+            self._set_meta("last_run", datetime.now().isoformat())
+            self._set_meta("total_articles", total)
         
-        logger.info(f"Finalized: {self.state['total_articles']} articles")
+        logger.info(f"Finalized: {total} articles")
         logger.info(f"Saved to: {self.articles_dir}")
 
+
+
+def open_article_store(backend: str = config.STATE_BACKEND, **kwargs) -> ArticleStore:
+    """
+    Create the article store for the configured state backend.
+    
+    Args:
+        backend: "json" (state.json / Spaces) or "sqlite" (config.STATE_DB)
+        **kwargs: Passed to the store constructor
+        
+    Returns:
+        ArticleStore instance
+    """
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteArticleStore
+        return SQLiteArticleStore(**kwargs)
+    if backend != "json":
+        raise ValueError(f"Unknown state backend: {backend}")
+    return ArticleStore(**kwargs)
@@ -0,0 +1,223 @@
+"""Asyncio Zendesk API client for public Help Center articles (no auth required)."""
+
+import json
+import asyncio
+import logging
+from typing import Dict, Any, Optional, AsyncIterator
+
+import requests
+from config import ZENDESK_SUBDOMAIN, ZENDESK_MAX_PER_PAGE, ASYNC_MAX_CONCURRENCY, HTTP_CACHE_ENABLED
+
+from .http_cache import HTTPCache
+from .rate_limiter import AdaptiveLimiter
+from .resilience import RetryPolicy, CircuitBreaker, RETRYABLE_STATUSES
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for async scraping
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZendeskClient:
+    """
+    Asyncio counterpart to ZendeskClient.
+
+    Uses one pooled keep-alive aiohttp session. get_articles is an async
+    generator over every page; get_article_content calls may be awaited
+    concurrently and are bounded by a semaphore. Use as an async context
+    manager so the connection pool is closed on exit.
+    """
+
+    def __init__(self, subdomain: str = "", max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+                 use_cache: bool = HTTP_CACHE_ENABLED, limiter: Optional[AdaptiveLimiter] = None,
+                 retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize async Zendesk client.
+
+        Args:
+            subdomain: Zendesk subdomain (e.g., "support.optisigns" for support.optisigns.com)
+            max_concurrency: Maximum requests in flight (also the connection pool size)
+            use_cache: Revalidate list pages and articles against the on-disk HTTP cache
+            limiter: Shared adaptive concurrency limiter (one is created if not provided)
+            retry: Backoff policy for transient failures (one is created if not provided)
+            breaker: Shared circuit breaker (one is created if not provided)
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncZendeskClient (pip install aiohttp)")
+
+        if subdomain == '':
+            subdomain = ZENDESK_SUBDOMAIN
+        self.subdomain = subdomain
+        self.base_url = f"https://{subdomain}.com/api/v2"
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache: Optional[HTTPCache] = HTTPCache() if use_cache else None
+        self.limiter = limiter or AdaptiveLimiter(max_limit=self.max_concurrency)
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.pages_fetched = 0
+        self.current_page_url: Optional[str] = None  # Page being read (None = first page)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncZendeskClient":
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Accept": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET a JSON resource under the concurrency semaphore, revalidating against the cache."""
+        if self._session is None:
+            raise RuntimeError("AsyncZendeskClient must be used as an async context manager")
+
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        entry = self.cache.get(full_url) if self.cache else None
+
+        async with self._semaphore:
+            throttled = 0
+            attempt = 0
+            while True:
+                self.breaker.before_call()
+                await self.limiter.acquire_async()
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                status = None
+                error = None
+                try:
+                    async with self._session.get(full_url, headers=HTTPCache.conditional_headers(entry)) as response:
+                        status = response.status
+                        if status == 429:
+                            # The host is up, just busy: pause every caller until the window reopens
+                            self.breaker.record_success()
+                            self.limiter.on_throttle(response.headers)
+                            if throttled < self.limiter.max_retries:
+                                throttled += 1
+                                self.limiter.record_retry()
+                                continue
+
+                        if status not in RETRYABLE_STATUSES:
+                            self.breaker.record_success()
+                            if status == 304 and entry:
+                                self.limiter.on_success(response.headers)
+                                self.cache.record_hit()
+                                return json.loads(entry["body"])
+
+                            response.raise_for_status()
+                            self.limiter.on_success(response.headers)
+                            body = await response.text()
+                            break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = e
+                finally:
+                    self.in_flight -= 1
+                    self.limiter.release()
+
+                # Timeout, connection error or 5xx: back off and retry
+                self.breaker.record_failure()
+                if attempt >= self.retry.max_retries:
+                    if error is not None:
+                        raise error
+                    raise aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=status, message=response.reason or ""
+                    )
+
+                delay = self.retry.backoff(attempt)
+                attempt += 1
+                reason = error or f"HTTP {status}"
+                logger.warning(f"Transient failure ({reason}), retry {attempt}/{self.retry.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        if self.cache:
+            self.cache.record_miss()
+            self.cache.store(
+                full_url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body=body
+            )
+        return json.loads(body)
+
+    async def get_articles(self, per_page: int = ZENDESK_MAX_PER_PAGE,
+                           next_page_url: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield articles across all pages of the Help Center API.
+
+        Args:
+            per_page: Number of articles per page (default: the API maximum)
+            next_page_url: Full next_page URL to resume from (optional)
+
+        Yields:
+            Article objects from the list endpoint (body included)
+        """
+        url = next_page_url or f"{self.base_url}/help_center/en-us/articles"
+        params = None if next_page_url else {
+            "per_page": per_page,
+            "sort_by": "updated_at",
+            "sort_order": "desc"
+        }
+
+        while url:
+            self.current_page_url = url if params is None else None
+            try:
+                data = await self._get_json(url, params=params)
+            except aiohttp.ClientError as e:
+                logger.error(f"Error fetching articles: {e}")
+                raise
+
+            self.pages_fetched += 1
+            articles = data.get("articles", [])
+            logger.info(f"Fetched {len(articles)} articles (page {self.pages_fetched})")
+            for article in articles:
+                yield article
+
+            url = data.get("next_page")
+            params = None
+
+    async def get_article_content(self, article_id: int) -> Dict[str, Any]:
+        """
+        Fetch detailed content for a single article.
+
+        Args:
+            article_id: Zendesk article ID
+
+        Returns:
+            Article object with full content
+        """
+        try:
+            url = f"{self.base_url}/help_center/en-us/articles/{article_id}"
+            data = await self._get_json(url)
+            return data.get("article", {})
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching article {article_id}: {e}")
+            raise
+
+    def throttle_stats(self) -> Dict[str, Any]:
+        """Get rate-limit statistics from the shared limiter."""
+        return self.limiter.stats()
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Get retry and circuit breaker statistics."""
+        return {**self.retry.stats(), **self.breaker.stats()}
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get HTTP cache hit/miss counters (zeros when caching is disabled)."""
+        if not self.cache:
+            return {"http_cache_hits": 0, "http_cache_misses": 0, "http_cache_evicted": 0}
+        return self.cache.stats()
@@ -0,0 +1,46 @@
+"""Size-bounded eviction for on-disk caches holding one file per entry."""
+
+import os
+from pathlib import Path
+from typing import Tuple
+
+
+def cache_size(cache_dir: Path, suffix: str) -> int:
+    """Get the total size in bytes of the entries (files ending in suffix) in a cache directory."""
+    return sum(entry.stat().st_size for entry in os.scandir(cache_dir) if entry.name.endswith(suffix))
+
+
+def evict_lru(cache_dir: Path, suffix: str, max_bytes: int) -> Tuple[int, int]:
+    """
+    Delete least recently used entries until the cache is at 90% of max_bytes.
+
+    Recency is the file mtime, so caches refresh it (os.utime) on every read.
+
+    Args:
+        cache_dir: Cache directory
+        suffix: File name suffix of cache entries (temporary files are left alone)
+        max_bytes: Size limit of the cache
+
+    Returns:
+        (remaining size in bytes, number of entries deleted)
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(suffix):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+
+    size = sum(entry_size for _, entry_size, _ in entries)
+    target = int(max_bytes * 0.9)
+    removed = 0
+    for _, entry_size, entry_path in entries:
+        if size <= target:
+            break
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+        size -= entry_size
+        removed += 1
+    return size, removed
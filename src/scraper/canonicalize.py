@@ -0,0 +1,74 @@
+"""Canonical form of converted Markdown, used only for change detection."""
+
+import re
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Bump whenever the rules below change; records hashed under another version
+# fall back to the raw hash for one run and are then re-hashed.
+CANONICAL_RULES_VERSION = "1"
+
+# Query parameters added by mail/ads tooling that do not change the target
+TRACKING_PARAMS = frozenset({
+    "gclid", "fbclid", "msclkid", "dclid", "yclid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "hsctatracking", "_ga", "_gl", "ref", "ref_src",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+_LINK_RE = re.compile(r'(!?)\[([^\]]*)\]\(([^)\s]*)\)')
+_SPACES_RE = re.compile(r'[^\S\n]+')
+_BLANK_LINES_RE = re.compile(r'\n{2,}')
+
+
+def _is_tracking(param: str) -> bool:
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str, is_image: bool = False) -> str:
+    """
+    Normalize a link target.
+
+    Tracking query parameters are dropped and the rest sorted. Image URLs
+    lose their scheme and host, since Zendesk serves the same attachment
+    from rotating CDN hostnames.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not _is_tracking(key))
+    scheme, netloc = ("", "") if is_image else (parts.scheme.lower(), parts.netloc.lower())
+    return urlunsplit((scheme, netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def _canonical_link(match: re.Match) -> str:
+    bang, text, url = match.groups()
+    return f"{bang}[{' '.join(text.split())}]({canonical_url(url, is_image=bool(bang))})"
+
+
+def canonicalize_markdown(markdown: str) -> str:
+    """
+    Reduce Markdown to a form that ignores cosmetic Zendesk edits.
+
+    Rules (CANONICAL_RULES_VERSION): normalize line endings, collapse runs of
+    whitespace inside lines, drop leading/trailing whitespace per line,
+    collapse blank-line runs, strip tracking query parameters from links and
+    mask image hosts. The result is only hashed, never stored or uploaded.
+
+    Args:
+        markdown: Cleaned Markdown from the converter
+
+    Returns:
+        Canonical text
+    """
+    text = markdown.replace('\r\n', '\n').replace('\r', '\n')
+    text = _LINK_RE.sub(_canonical_link, text)
+    text = '\n'.join(_SPACES_RE.sub(' ', line).strip() for line in text.split('\n'))
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+
+def canonical_hash(markdown: str) -> str:
+    """Get the MD5 of the canonical form of a Markdown document."""
+    return hashlib.md5(canonicalize_markdown(markdown).encode()).hexdigest()
@@ -0,0 +1,110 @@
+"""Content-addressed cache of converted Markdown, keyed by raw HTML."""
+
+import os
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import CONVERSION_CACHE_DIR, CONVERSION_CACHE_MAX_MB
+
+from .html_to_md import CONVERTER_FINGERPRINT
+from .cache_eviction import cache_size, evict_lru
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionCache:
+    """
+    On-disk map from sha256(converter fingerprint, base_url, HTML) to cleaned Markdown.
+
+    An unchanged article body costs one hash and one file read instead of a
+    full parse. CONVERTER_FINGERPRINT (CONVERTER_VERSION plus the skip lists)
+    is part of the key, so bumping the version or editing a skip list makes
+    every old entry unreachable; stale entries age out through eviction.
+    Reads refresh an entry's mtime, and when the cache grows past max_bytes
+    the least recently used entries are deleted.
+    """
+
+    def __init__(self, cache_dir: str = str(CONVERSION_CACHE_DIR),
+                 max_bytes: int = CONVERSION_CACHE_MAX_MB * 1024 * 1024):
+        """
+        Initialize conversion cache.
+
+        Args:
+            cache_dir: Directory holding cached Markdown
+            max_bytes: Total size above which LRU entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._size: Optional[int] = None  # Computed on first write
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(html: str, base_url: str = "", fingerprint: str = CONVERTER_FINGERPRINT) -> str:
+        """Get the cache key for an article body converted under a converter fingerprint."""
+        digest = hashlib.sha256(fingerprint.encode("utf-8"))
+        digest.update(b"\0" + base_url.encode("utf-8") + b"\0")
+        digest.update(html.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.md"
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached Markdown for a key, or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                markdown = f.read()
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            markdown = None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable conversion cache entry {key}: {e}")
+            markdown = None
+
+        with self._lock:
+            if markdown is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return markdown
+
+    def put(self, key: str, markdown: str):
+        """Store Markdown for a key, evicting old entries if the cache is full."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write conversion cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = cache_size(self.cache_dir, ".md")
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._size, removed = evict_lru(self.cache_dir, ".md", self.max_bytes)
+                self.evicted += removed
+                logger.info(f"Conversion cache evicted to {self._size / (1024 * 1024):.1f} MB "
+                            f"({self.evicted} entries so far)")
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "conversion_cache_hits": self.hits,
+                "conversion_cache_misses": self.misses,
+                "conversion_cache_evicted": self.evicted
+            }
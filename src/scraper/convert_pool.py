@@ -0,0 +1,144 @@
+"""Process-pool executor for HTML -> Markdown conversion."""
+
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from config import CONVERT_PROCESSES, CONVERT_POOL_MIN_BATCH, CONVERT_CHUNKSIZE, CONVERSION_CACHE_ENABLED
+
+from .html_to_md import html_to_markdown, clean_markdown
+from .conversion_cache import ConversionCache
+
+logger = logging.getLogger(__name__)
+
+
+def convert_html(item: Tuple[str, str]) -> str:
+    """
+    Convert one article body to cleaned Markdown.
+
+    Module-level so it can be pickled and run in a pool worker.
+
+    Args:
+        item: (html_body, base_url) pair
+
+    Returns:
+        Cleaned markdown text
+    """
+    html_body, base_url = item
+    return clean_markdown(html_to_markdown(html_body, base_url=base_url))
+
+
+class ConversionExecutor:
+    """
+    Convert batches of articles, in a process pool when the batch is big enough.
+
+    HTMLToMarkdownConverter is pure Python and holds the GIL, so threads do not
+    speed it up. Large batches are sent to worker processes in chunks of
+    chunksize articles to amortize pickling; small batches (and any batch when
+    processes <= 1) are converted in-process. The pool is started lazily, so
+    runs that never see a large batch never pay for it. Bodies already in the
+    conversion cache are not converted at all, and only cache misses count
+    towards the batch size.
+    """
+
+    def __init__(self, processes: int = CONVERT_PROCESSES, min_batch: int = CONVERT_POOL_MIN_BATCH,
+                 chunksize: int = CONVERT_CHUNKSIZE, use_cache: bool = CONVERSION_CACHE_ENABLED):
+        """
+        Initialize conversion executor.
+
+        Args:
+            processes: Worker processes (1 = always convert in-process)
+            min_batch: Batches smaller than this are converted in-process
+            chunksize: Articles per task sent to a worker
+            use_cache: Reuse Markdown from the on-disk conversion cache
+        """
+        self.cache: Optional[ConversionCache] = ConversionCache() if use_cache else None
+        self.processes = max(1, processes)
+        self.min_batch = max(1, min_batch)
+        self.chunksize = max(1, chunksize)
+        self.pool_conversions = 0
+        self.inline_conversions = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ConversionExecutor":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the pool on first use."""
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking a process that is running pipeline threads can deadlock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started conversion pool with {self.processes} processes")
+            return self._pool
+
+    def convert_many(self, items: List[Tuple[str, str]]) -> List[str]:
+        """
+        Convert (html_body, base_url) pairs, preserving order.
+
+        Args:
+            items: Article bodies with their base URLs
+
+        Returns:
+            Cleaned markdown for each item
+        """
+        if not self.cache:
+            return self._convert(items)
+
+        keys = [ConversionCache.key(html, base_url) for html, base_url in items]
+        results = [self.cache.get(key) for key in keys]
+        missing = [n for n, markdown in enumerate(results) if markdown is None]
+        if missing:
+            converted = self._convert([items[n] for n in missing])
+            for n, markdown in zip(missing, converted):
+                results[n] = markdown
+                self.cache.put(keys[n], markdown)
+        return results
+
+    def _convert(self, items: List[Tuple[str, str]]) -> List[str]:
+        """Convert items in the pool or in-process, depending on batch size."""
+        if self.processes > 1 and len(items) >= self.min_batch:
+            try:
+                results = list(self._get_pool().map(convert_html, items, chunksize=self.chunksize))
+                with self._lock:
+                    self.pool_conversions += len(items)
+                return results
+            except BrokenProcessPool as e:
+                logger.warning(f"Conversion pool failed ({e}) - converting in-process from now on")
+                self.shutdown()
+                self.processes = 1
+
+        results = [convert_html(item) for item in items]
+        with self._lock:
+            self.inline_conversions += len(items)
+        return results
+
+    def shutdown(self):
+        """Stop the worker processes (no-op if the pool never started)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def stats(self) -> Dict[str, int]:
+        """Get how many articles were converted in the pool vs in-process, plus cache counters."""
+        with self._lock:
+            stats = {
+                "pool_conversions": self.pool_conversions,
+                "inline_conversions": self.inline_conversions
+            }
+        if self.cache:
+            stats.update(self.cache.stats())
+        else:
+            stats.update({"conversion_cache_hits": 0, "conversion_cache_misses": 0, "conversion_cache_evicted": 0})
+        return stats
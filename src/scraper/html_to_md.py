@@ -1,20 +1,76 @@
 """Convert HTML content to clean Markdown."""
 
 import re
+import hashlib
 import logging
 from html.parser import HTMLParser
+from typing import Iterable, Iterator
 from urllib.parse import urljoin, urlparse
 
+from config import SKIP_TAGS, SKIP_CLASSES
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever html_to_markdown or clean_markdown code changes its output. Skip list edits
+# need no bump: both are folded into CONVERTER_FINGERPRINT, which keys the conversion cache
+# and makes ArticleStore.is_up_to_date re-convert every stored article on the next run.
+CONVERTER_VERSION = "2"
+
+
+def converter_fingerprint(skip_tags=SKIP_TAGS, skip_classes=SKIP_CLASSES) -> str:
+    """Identify converter output: CONVERTER_VERSION plus a digest of the skip lists."""
+    digest = hashlib.sha256(
+        ("\0".join(sorted(skip_tags)) + "\1" + "\0".join(sorted(skip_classes))).encode("utf-8")
+    ).hexdigest()
+    return f"{CONVERTER_VERSION}+{digest[:12]}"
+
+
+CONVERTER_FINGERPRINT = converter_fingerprint()
+
+
+# Tags whose opening/closing tag only emits fixed text
+_START_TEXT = {
+    **{f'h{level}': '\n' + '#' * level + ' ' for level in range(1, 7)},
+    'p': '\n',
+    'br': '\n',
+    'strong': '**',
+    'b': '**',
+    'em': '*',
+    'i': '*',
+    'blockquote': '\n> ',
+}
+_END_TEXT = {
+    **{f'h{level}': '\n' for level in range(1, 7)},
+    'p': '\n',
+    'strong': '**',
+    'b': '**',
+    'em': '*',
+    'i': '*',
+    'blockquote': '\n',
+}
+
+# Elements without an end tag; they can never open a skipped subtree
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'
+})
+
 
 class HTMLToMarkdownConverter(HTMLParser):
-    """Convert HTML to Markdown format."""
+    """
+    Convert HTML to Markdown format.
+    
+    Subtrees rooted at a tag in skip_tags, or at an element carrying a class in
+    skip_classes, are dropped while parsing (text, links and images alike).
+    """
     
-    def __init__(self, base_url: str = ""):
+    def __init__(self, base_url: str = "", skip_tags=SKIP_TAGS, skip_classes=SKIP_CLASSES):
         super().__init__()
         self.reset()
         self.base_url = base_url
+        self.skip_tags = frozenset(skip_tags)
+        self.skip_classes = frozenset(skip_classes)
+        self._skip_tag = None  # Tag that opened the subtree being skipped
+        self._skip_depth = 0  # Open elements of that tag inside the skipped subtree
         self.markdown = []
         self.current_list = []
         self.list_stack = []
@@ -22,101 +78,129 @@ class HTMLToMarkdownConverter(HTMLParser):
         self.in_pre = False
         self.code_buffer = []
     
+    def _starts_skip(self, tag, attrs) -> bool:
+        """Check whether this element opens a subtree to drop."""
+        if tag in self.skip_tags:
+            return True
+        if self.skip_classes:
+            for name, value in attrs:
+                if name == 'class' and value and not self.skip_classes.isdisjoint(value.split()):
+                    return True
+        return False
+    
     def handle_starttag(self, tag, attrs):
         """Handle opening tags."""
-        attrs_dict = dict(attrs)
-        
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            level = int(tag[1])
-            self.markdown.append('\n' + '#' * level + ' ')
-        
-        elif tag == 'p':
-            self.markdown.append('\n')
-        
-        elif tag == 'br':
-            self.markdown.append('\n')
-        
-        elif tag in ['ul', 'ol']:
-            self.list_stack.append(tag)
-        
-        elif tag == 'li':
-            if self.list_stack:
-                indent = '  ' * (len(self.list_stack) - 1)
-                if self.list_stack[-1] == 'ul':
-                    self.markdown.append(f'\n{indent}• ')
-                else:
-                    self.markdown.append(f'\n{indent}1. ')
-        
-        elif tag == 'strong' or tag == 'b':
-            self.markdown.append('**')
-        
-        elif tag == 'em' or tag == 'i':
-            self.markdown.append('*')
-        
-        elif tag == 'code':
-            self.in_code = True
-            self.markdown.append('`')
-        
-        elif tag == 'pre':
-            self.in_pre = True
-            self.code_buffer = []
-            self.markdown.append('\n```\n')
+        if self._skip_depth:
+            # Count nested elements of the same tag so the right end tag closes the skip
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag not in _VOID_TAGS and self._starts_skip(tag, attrs):
+            self._skip_tag = tag
+            self._skip_depth = 1
+            return
         
-        elif tag == 'a':
-            href = attrs_dict.get('href', '#')
-            # Convert relative URLs to absolute
-            if href and href.startswith('/'):
-                href = urljoin(self.base_url, href)
-            self.markdown.append('[')
-            self._temp_href = href
-        
-        elif tag == 'img':
-            src = attrs_dict.get('src', '')
-            alt = attrs_dict.get('alt', 'image')
-            if src and src.startswith('/'):
-                src = urljoin(self.base_url, src)
-            self.markdown.append(f'![{alt}]({src})')
-        
-        elif tag == 'blockquote':
-            self.markdown.append('\n> ')
+        text = _START_TEXT.get(tag)
+        if text is not None:
+            self.markdown.append(text)
+            return
         
-        elif tag in ['div', 'section', 'article']:
-            # Skip wrapper divs
-            pass
+        handler = self._START_HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, tag, attrs)
     
     def handle_endtag(self, tag):
         """Handle closing tags."""
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']:
-            self.markdown.append('\n')
-        
-        elif tag in ['ul', 'ol']:
-            if self.list_stack:
-                self.list_stack.pop()
-            self.markdown.append('\n')
-        
-        elif tag in ['strong', 'b']:
-            self.markdown.append('**')
-        
-        elif tag in ['em', 'i']:
-            self.markdown.append('*')
+        if self._skip_depth:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+            return
         
-        elif tag == 'code':
-            self.in_code = False
-            self.markdown.append('`')
-        
-        elif tag == 'pre':
-            self.in_pre = False
-            self.markdown.append('\n```\n')
-        
-        elif tag == 'a':
-            self.markdown.append(f']({self._temp_href})')
-            self._temp_href = None
+        text = _END_TEXT.get(tag)
+        if text is not None:
+            self.markdown.append(text)
+            return
         
-        elif tag == 'blockquote':
-            self.markdown.append('\n')
+        handler = self._END_HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, tag)
+    
+    def _start_list(self, tag, attrs):
+        self.list_stack.append(tag)
+    
+    def _start_li(self, tag, attrs):
+        if self.list_stack:
+            indent = '  ' * (len(self.list_stack) - 1)
+            if self.list_stack[-1] == 'ul':
+                self.markdown.append(f'\n{indent}• ')
+            else:
+                self.markdown.append(f'\n{indent}1. ')
+    
+    def _start_code(self, tag, attrs):
+        self.in_code = True
+        self.markdown.append('`')
+    
+    def _start_pre(self, tag, attrs):
+        self.in_pre = True
+        self.code_buffer = []
+        self.markdown.append('\n```\n')
+    
+    def _start_a(self, tag, attrs):
+        href = dict(attrs).get('href', '#')
+        # Convert relative URLs to absolute
+        if href and href.startswith('/'):
+            href = urljoin(self.base_url, href)
+        self.markdown.append('[')
+        self._temp_href = href
+    
+    def _start_img(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        src = attrs_dict.get('src', '')
+        alt = attrs_dict.get('alt', 'image')
+        if src and src.startswith('/'):
+            src = urljoin(self.base_url, src)
+        self.markdown.append(f'![{alt}]({src})')
+    
+    def _end_list(self, tag):
+        if self.list_stack:
+            self.list_stack.pop()
+        self.markdown.append('\n')
+    
+    def _end_code(self, tag):
+        self.in_code = False
+        self.markdown.append('`')
+    
+    def _end_pre(self, tag):
+        self.in_pre = False
+        self.markdown.append('\n```\n')
+    
+    def _end_a(self, tag):
+        self.markdown.append(f']({self._temp_href})')
+        self._temp_href = None
+    
+    # Tags that need state or attributes; anything not listed (div, span, ...) is ignored
+    _START_HANDLERS = {
+        'ul': _start_list,
+        'ol': _start_list,
+        'li': _start_li,
+        'code': _start_code,
+        'pre': _start_pre,
+        'a': _start_a,
+        'img': _start_img,
+    }
+    _END_HANDLERS = {
+        'ul': _end_list,
+        'ol': _end_list,
+        'code': _end_code,
+        'pre': _end_pre,
+        'a': _end_a,
+    }
     
     def handle_data(self, data):
         """Handle text content."""
+        if self._skip_depth:
+            return
+        
         if not data.strip():
             # Preserve single spaces between words
             if self.markdown and not self.markdown[-1].endswith(' '):
@@ -163,6 +247,143 @@ def html_to_markdown(html_content: str, base_url: str = "") -> str:
         return html_content
 
 
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'\n\n\n+')
+
+# Nav/ad patterns (common in Zendesk). Each runs to the next blank line or the
+# end of the text; written without a lazy DOTALL lookahead so a match is found
+# in one forward scan.
+_TO_PARAGRAPH_END = r'[^\n]*(?:\n(?!\n|\Z)[^\n]*)*'
+_BOILERPLATE_PHRASES = ('was this article helpful?', 'related articles', 'did you find it helpful?')
+# Non-ASCII letters IGNORECASE matches against ASCII ones (İ, ı, ſ, Kelvin sign)
+_FOLDS_TO_ASCII = '\u0130\u0131\u017f\u212a'
+_BOILERPLATE_PATTERNS = [
+    re.compile(re.escape(phrase) + _TO_PARAGRAPH_END, re.IGNORECASE)
+    for phrase in _BOILERPLATE_PHRASES
+]
+
+
+def _may_contain_boilerplate(text: str) -> bool:
+    """Cheap pre-check so the case-insensitive patterns only run when they can match."""
+    if any(char in text for char in _FOLDS_TO_ASCII):
+        return True
+    lowered = text.lower()
+    return any(phrase in lowered for phrase in _BOILERPLATE_PHRASES)
+
+
+class _StreamNormalizer:
+    """
+    Apply get_markdown's newline collapsing and strip() to text arriving in pieces.
+    
+    Trailing whitespace is held back until more text arrives, so a run of
+    newlines split across pieces is collapsed as a whole and whitespace at the
+    very end is never emitted.
+    """
+    
+    def __init__(self):
+        self._started = False
+        self._tail = ''
+    
+    def push(self, text: str) -> str:
+        text = self._tail + text
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                self._tail = ''
+                return ''
+            self._started = True
+        body = text.rstrip()
+        self._tail = text[len(body):]
+        return _BLANK_LINES_RE.sub('\n\n', body)
+
+
+def iter_html_to_markdown(chunks: Iterable[str], base_url: str = "") -> Iterator[str]:
+    """
+    Convert HTML arriving in chunks to Markdown, yielding it incrementally.
+    
+    The concatenated output equals html_to_markdown() on the joined input.
+    Input is fed to the parser only up to the last '<' seen, so a text run is
+    never split across chunk boundaries, and converted fragments are released
+    as soon as they are final. Memory is bounded by the largest single tag or
+    text run rather than by the whole article, so a tag carrying a large
+    inline data: URI (e.g. an embedded image) is still held in full.
+    
+    Unlike html_to_markdown(), which returns the raw HTML when the parser
+    fails (e.g. on a stray </a>), a failure raises ValueError: earlier pieces
+    may already have been yielded and the input is not kept, so there is no
+    raw text to fall back to. Callers that need the fallback should join the
+    chunks and call html_to_markdown() instead.
+    
+    Args:
+        chunks: HTML text chunks (e.g. a streamed HTTP response decoded to str)
+        base_url: Base URL for relative link conversion
+        
+    Yields:
+        Markdown text pieces
+        
+    Raises:
+        ValueError: If the HTML cannot be converted
+    """
+    converter = HTMLToMarkdownConverter(base_url=base_url)
+    normalizer = _StreamNormalizer()
+    pending = []
+    
+    def drain():
+        # Keep the last fragment: handle_data looks at it to decide on spacing
+        fragments = converter.markdown
+        if len(fragments) > 1:
+            converter.markdown = fragments[-1:]
+            return normalizer.push(''.join(fragments[:-1]))
+        return ''
+    
+    try:
+        for chunk in chunks:
+            cut = chunk.rfind('<')
+            if cut < 0:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            converter.feed(''.join(pending))
+            pending = [chunk[cut:]]
+            text = drain()
+            if text:
+                yield text
+        
+        converter.feed(''.join(pending))
+        text = normalizer.push(''.join(converter.markdown))
+        if text:
+            yield text
+    except Exception as e:
+        logger.error(f"Error converting streamed HTML to Markdown: {e}")
+        raise ValueError(f"Cannot convert streamed HTML to Markdown: {e}") from e
+
+
+def write_markdown_stream(chunks: Iterable[str], path: str, base_url: str = "") -> int:
+    """
+    Convert streamed HTML straight into a Markdown file.
+    
+    On a conversion error (see iter_html_to_markdown) the file is left
+    partially written.
+    
+    Args:
+        chunks: HTML text chunks
+        path: Output file path
+        base_url: Base URL for relative link conversion
+        
+    Returns:
+        Number of characters written
+        
+    Raises:
+        ValueError: If the HTML cannot be converted
+    """
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for text in iter_html_to_markdown(chunks, base_url=base_url):
+            f.write(text)
+            written += len(text)
+    return written
+
+
 def clean_markdown(markdown_text: str) -> str:
     """
     Clean up Markdown text.
@@ -174,22 +395,20 @@ def clean_markdown(markdown_text: str) -> str:
         Cleaned markdown text
     """
     # Remove HTML comments
-    markdown_text = re.sub(r'<!--.*?-->', '', markdown_text, flags=re.DOTALL)
+    if '<!--' in markdown_text:
+        markdown_text = _COMMENT_RE.sub('', markdown_text)
     
     # Remove multiple blank lines
-    markdown_text = re.sub(r'\n\n\n+', '\n\n', markdown_text)
+    markdown_text = _BLANK_LINES_RE.sub('\n\n', markdown_text)
     
     # Remove trailing whitespace
     markdown_text = '\n'.join(line.rstrip() for line in markdown_text.split('\n'))
     
-    # Remove nav/ad patterns (common in Zendesk)
-    patterns = [
-        r'Was this article helpful\?.*?(?=\n\n|$)',
-        r'Related articles.*?(?=\n\n|$)',
-        r'Did you find it helpful\?.*?(?=\n\n|$)',
-    ]
-    for pattern in patterns:
-        markdown_text = re.sub(pattern, '', markdown_text, flags=re.IGNORECASE | re.DOTALL)
+    # Remove nav/ad patterns, in order, only if any of them occurs. Theme widgets
+    # are already dropped by the converter's SKIP_CLASSES; this catches the same
+    # phrases when they are written into the article body as plain text.
+    if _may_contain_boilerplate(markdown_text):
+        for pattern in _BOILERPLATE_PATTERNS:
+            markdown_text = pattern.sub('', markdown_text)
     
     return markdown_text.strip()
-
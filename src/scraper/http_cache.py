@@ -0,0 +1,126 @@
+"""Persistent HTTP cache storing response bodies and validators per URL."""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_MB
+
+from .cache_eviction import cache_size, evict_lru
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """
+    On-disk cache for conditional GETs (ETag / Last-Modified).
+
+    Each URL maps to one JSON file holding the validators and the response
+    body. Callers send the validators back as If-None-Match / If-Modified-Since
+    and serve the cached body when the server answers 304 Not Modified.
+    Reads refresh an entry's mtime, and when the cache grows past max_bytes
+    the least recently used entries are deleted.
+    """
+
+    def __init__(self, cache_dir: str = str(HTTP_CACHE_DIR),
+                 max_bytes: int = HTTP_CACHE_MAX_MB * 1024 * 1024):
+        """
+        Initialize HTTP cache.
+
+        Args:
+            cache_dir: Directory holding cached responses
+            max_bytes: Total size above which LRU entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._size: Optional[int] = None  # Computed on first write
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        """Get cache file path for a URL."""
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached entry (etag, last_modified, body) for a URL, or None."""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # Mark as recently used
+            return entry
+        except FileNotFoundError:
+            return None  # Evicted since the exists() check
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build revalidation headers from a cached entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        """Store a response body with its validators (no-op without validators)."""
+        if not etag and not last_modified:
+            return
+        path = self._path(url)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body": body
+                }, f)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = cache_size(self.cache_dir, ".json")
+            else:
+                self._size += size  # Overwrites are over-counted until the next eviction rescans
+            if self._size > self.max_bytes:
+                self._size, removed = evict_lru(self.cache_dir, ".json", self.max_bytes)
+                self.evicted += removed
+                logger.info(f"HTTP cache evicted to {self._size / (1024 * 1024):.1f} MB "
+                            f"({self.evicted} entries so far)")
+
+    def record_hit(self):
+        """Count a response served from cache (304)."""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        """Count a response downloaded in full."""
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "http_cache_hits": self.hits,
+                "http_cache_misses": self.misses,
+                "http_cache_evicted": self.evicted
+            }
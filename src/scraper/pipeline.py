@@ -0,0 +1,199 @@
+"""Staged worker pipeline connected by bounded queues."""
+
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage:
+    """
+    One pipeline stage: a function applied to each job by a pool of threads.
+
+    Jobs are dicts. If the function raises, the exception is stored in
+    job["error"] and later stages pass the job through untouched, except an
+    ordered stage, which always sees every job (so it can count failures).
+    With batch_size > 1 the function receives a list of whatever jobs are
+    already queued (up to batch_size) instead of a single job.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], None], workers: int = 1,
+                 ordered: bool = False, batch_size: int = 1):
+        """
+        Initialize stage.
+
+        Args:
+            name: Stage name used in stats
+            func: Callable run on each job dict (mutates it in place)
+            workers: Threads running this stage
+            ordered: Deliver jobs in submission order (forces a single worker)
+            batch_size: Max jobs handed to func per call (ignored when ordered)
+        """
+        self.name = name
+        self.func = func
+        self.ordered = ordered
+        self.workers = 1 if ordered else max(1, workers)
+        self.batch_size = 1 if ordered else max(1, batch_size)
+        self.items = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _record(self, elapsed: float, items: int = 1):
+        with self._lock:
+            self.items += items
+            self.busy_seconds += elapsed
+
+
+class Pipeline:
+    """
+    Run jobs through stages connected by bounded queues.
+
+    Each queue holds at most queue_size jobs, so a slow stage blocks the ones
+    before it (back-pressure). The number of jobs between feeding and the end
+    of the last stage is capped as well, which also bounds an ordered stage's
+    reorder buffer while one slow job holds back the ones behind it, so
+    memory stays flat however many jobs are fed.
+    Per-stage busy time is tracked so the run can report which stage is the
+    bottleneck.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 16):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity of each inter-stage queue
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.wall_seconds = 0.0
+
+    def run(self, jobs: Iterable[Dict[str, Any]]):
+        """Feed jobs through every stage and wait until all are done."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        # A slot per queued job and per job a worker may hold; released after the last stage
+        window = threading.Semaphore(self.queue_size * len(self.stages)
+                                     + sum(stage.workers for stage in self.stages))
+        threads = []
+        start = time.perf_counter()
+
+        for position, stage in enumerate(self.stages):
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(self.stages) else None
+            next_workers = self.stages[position + 1].workers if outbox is not None else 0
+            finished = {"count": 0}
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(stage, inbox, outbox, next_workers, finished, window),
+                    name=f"{stage.name}-{n}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        for seq, job in enumerate(jobs):
+            job["_seq"] = seq
+            window.acquire()
+            queues[0].put(job)
+        for _ in range(self.stages[0].workers):
+            queues[0].put(_DONE)
+
+        for thread in threads:
+            thread.join()
+        self.wall_seconds += time.perf_counter() - start
+
+    @staticmethod
+    def _work(stage: Stage, inbox: "queue.Queue", outbox: Optional["queue.Queue"],
+              next_workers: int, finished: Dict[str, int], window: threading.Semaphore):
+        """Worker loop for one stage thread."""
+        pending = {}
+        next_seq = 0
+
+        def handle(job):
+            if stage.ordered or "error" not in job:
+                started = time.perf_counter()
+                try:
+                    stage.func(job)
+                except Exception as e:
+                    job["error"] = e
+                stage._record(time.perf_counter() - started)
+            if outbox is not None:
+                outbox.put(job)
+            else:
+                window.release()
+
+        def handle_batch(jobs):
+            todo = [job for job in jobs if "error" not in job]
+            if todo:
+                started = time.perf_counter()
+                try:
+                    stage.func(todo)
+                except Exception as e:
+                    for job in todo:
+                        job.setdefault("error", e)
+                stage._record(time.perf_counter() - started, len(todo))
+            for job in jobs:
+                if outbox is not None:
+                    outbox.put(job)
+                else:
+                    window.release()
+
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                break
+            if stage.batch_size > 1:
+                # Take whatever else is already queued, without waiting for more
+                batch = [job]
+                done = False
+                while len(batch) < stage.batch_size:
+                    try:
+                        job = inbox.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is _DONE:
+                        done = True
+                        break
+                    batch.append(job)
+                handle_batch(batch)
+                if done:
+                    break
+                continue
+            if not stage.ordered:
+                handle(job)
+                continue
+            # Reorder buffer: release jobs strictly in submission order
+            pending[job["_seq"]] = job
+            while next_seq in pending:
+                handle(pending.pop(next_seq))
+                next_seq += 1
+
+        for seq in sorted(pending):
+            handle(pending[seq])
+
+        with stage._lock:
+            finished["count"] += 1
+            last = finished["count"] == stage.workers
+        if last and outbox is not None:
+            for _ in range(next_workers):
+                outbox.put(_DONE)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-stage items, busy time and utilization (busy / worker wall time)."""
+        stats = {}
+        for stage in self.stages:
+            capacity = stage.workers * self.wall_seconds
+            stats[stage.name] = {
+                "workers": stage.workers,
+                "items": stage.items,
+                "busy_seconds": round(stage.busy_seconds, 3),
+                "utilization": round(stage.busy_seconds / capacity, 3) if capacity else 0.0,
+            }
+        return stats
@@ -0,0 +1,164 @@
+"""Adaptive (AIMD) concurrency limiter driven by Zendesk rate-limit headers."""
+
+import time
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+from config import (
+    FETCH_MAX_WORKERS,
+    RATE_LIMIT_MAX_CONCURRENCY,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMIT_LOW_WATERMARK,
+)
+
+logger = logging.getLogger(__name__)
+
+# Zendesk reports remaining quota under either header depending on the endpoint
+REMAINING_HEADERS = ("X-Rate-Limit-Remaining", "ratelimit-remaining")
+
+
+class AdaptiveLimiter:
+    """
+    Shared concurrency limit for Zendesk requests.
+
+    Additive increase on success, multiplicative decrease on 429 or when the
+    remaining quota drops below a watermark. A 429 with Retry-After pauses all
+    callers until the server's window reopens. Works from threads (acquire) and
+    from asyncio tasks (acquire_async).
+    """
+
+    def __init__(self, initial: int = FETCH_MAX_WORKERS, min_limit: int = 1,
+                 max_limit: int = RATE_LIMIT_MAX_CONCURRENCY,
+                 max_retries: int = RATE_LIMIT_MAX_RETRIES,
+                 low_watermark: int = RATE_LIMIT_LOW_WATERMARK):
+        """
+        Initialize limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lowest concurrency the limiter will back off to
+            max_limit: Highest concurrency the limiter will grow to
+            max_retries: Retries allowed per throttled request
+            low_watermark: Remaining-quota level that triggers a proactive backoff
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.max_retries = max_retries
+        self.low_watermark = low_watermark
+        self.in_flight = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._stats = {
+            "throttled": 0,
+            "throttle_retries": 0,
+            "throttle_wait_seconds": 0.0,
+            "min_concurrency": int(self.limit),
+            "max_concurrency": int(self.limit),
+        }
+
+    def _pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free and no pause is active."""
+        with self._cond:
+            if self._pause_remaining() > 0 or self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self):
+        """Block the calling thread until a slot is free."""
+        with self._cond:
+            while True:
+                pause = self._pause_remaining()
+                if pause <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._cond.wait(timeout=pause if pause > 0 else None)
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a slot is free."""
+        while not self.try_acquire():
+            with self._cond:
+                pause = self._pause_remaining()
+            await asyncio.sleep(pause if pause > 0 else 0.01)
+
+    def release(self):
+        """Return a slot."""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def _set_limit(self, limit: float):
+        self.limit = min(max(limit, float(self.min_limit)), float(self.max_limit))
+        self._stats["min_concurrency"] = min(self._stats["min_concurrency"], int(self.limit))
+        self._stats["max_concurrency"] = max(self._stats["max_concurrency"], int(self.limit))
+        self._cond.notify_all()
+
+    @staticmethod
+    def _remaining(headers: Mapping[str, str]) -> Optional[int]:
+        for name in REMAINING_HEADERS:
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+        if not value:
+            return default
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return default
+
+    def on_success(self, headers: Mapping[str, str]):
+        """Grow the limit by ~1 per window of successes, or back off if quota runs low."""
+        with self._cond:
+            remaining = self._remaining(headers)
+            if remaining is not None and remaining <= self.low_watermark:
+                self._set_limit(self.limit / 2)
+            else:
+                self._set_limit(self.limit + 1.0 / self.limit)
+
+    def on_throttle(self, headers: Mapping[str, str]) -> float:
+        """
+        Halve the limit and pause all callers for Retry-After seconds.
+
+        Returns:
+            Seconds until requests may resume
+        """
+        wait = self.parse_retry_after(headers.get("Retry-After"))
+        with self._cond:
+            self._stats["throttled"] += 1
+            self._stats["throttle_wait_seconds"] += wait
+            self._paused_until = max(self._paused_until, time.monotonic() + wait)
+            self._set_limit(self.limit / 2)
+        logger.warning(f"Rate limited by Zendesk: pausing {wait:.1f}s, concurrency limit now {int(self.limit)}")
+        return wait
+
+    def record_retry(self):
+        """Count a retried throttled request."""
+        with self._cond:
+            self._stats["throttle_retries"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get per-run throttle statistics."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["throttle_wait_seconds"] = round(stats["throttle_wait_seconds"], 1)
+            stats["concurrency_limit"] = int(self.limit)
+            return stats
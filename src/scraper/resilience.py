@@ -0,0 +1,129 @@
+"""Retry backoff and circuit breaker for idempotent Zendesk GETs."""
+
+import time
+import random
+import logging
+import threading
+from typing import Dict, Any
+
+from config import (
+    RETRY_MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Server-side failures worth retrying (429 is handled by the rate limiter)
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter."""
+
+    def __init__(self, max_retries: int = RETRY_MAX_RETRIES, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff for the first retry (seconds)
+            max_delay: Upper bound on any single backoff (seconds)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """Get a jittered delay for the given retry number (0-based) and count the retry."""
+        with self._lock:
+            self.retries += 1
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get retry count for the run summary."""
+        with self._lock:
+            return {"transient_retries": self.retries}
+
+
+class CircuitBreaker:
+    """
+    Stop calling a host after repeated failures.
+
+    Closed: calls pass through; consecutive failures are counted.
+    Open: calls fail fast with CircuitOpenError until reset_timeout elapses.
+    Half-open: one trial call is let through; success closes, failure re-opens.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_SECONDS):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being refused."""
+        with self._lock:
+            return self.state == "open" and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may proceed."""
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Circuit open: Zendesk is failing, not sending request")
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                raise CircuitOpenError("Circuit half-open: trial request already in flight")
+            self._trial_in_flight = True
+
+    def record_success(self):
+        """Reset failures and close the circuit."""
+        with self._lock:
+            if self.state != "closed":
+                logger.info("Circuit closed: Zendesk is responding again")
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.times_opened += 1
+                    logger.error(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get breaker state for the run summary."""
+        with self._lock:
+            return {"circuit_state": self.state, "circuit_opened": self.times_opened}
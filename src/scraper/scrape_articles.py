@@ -1,12 +1,37 @@
 """Main scraping orchestration logic."""
 
+import time
+import asyncio
 import logging
 import hashlib
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+import requests
+
+from config import (
+    FETCH_MAX_WORKERS,
+    TRUST_LIST_PAYLOAD,
+    CONVERT_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    FORCE_REFRESH,
+    ZENDESK_MAX_PER_PAGE,
+    ASYNC_MAX_CONCURRENCY,
+    SIGNIFICANCE_CHECK_ENABLED,
+    SIGNIFICANCE_MIN_CHANGE,
+    SIGNIFICANCE_MAX_STALENESS_HOURS,
+)
 from .zendesk_client import ZendeskClient
-from .html_to_md import html_to_markdown, clean_markdown
-from .article_store import ArticleStore
+from .async_zendesk_client import AsyncZendeskClient, aiohttp
+from .rate_limiter import AdaptiveLimiter
+from .resilience import RetryPolicy, CircuitBreaker, CircuitOpenError
+from .pipeline import Pipeline, Stage
+from .convert_pool import ConversionExecutor
+from .canonicalize import canonical_hash
+from .significance import signature, change_fraction
+from .article_store import ArticleStore, open_article_store
 
 logger = logging.getLogger(__name__)
 
@@ -29,133 +54,580 @@ class ArticleScraper:
         """
 
         
-        self.client = ZendeskClient()
+        # One limiter, retry policy and breaker shared by every request (sync or async)
+        self.limiter = AdaptiveLimiter()
+        self.retry = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.client = ZendeskClient(limiter=self.limiter, retry=self.retry, breaker=self.breaker)
         # Allow sharing a single store instance to avoid state overwrite in multi-phase jobs
-        self.store = store or ArticleStore(articles_dir=articles_dir, state_file=state_file)
+        self.store = store or open_article_store(articles_dir=articles_dir, state_file=state_file)
         self.subdomain = self.client.subdomain
+        self.converter = ConversionExecutor()
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._in_flight_lock = threading.Lock()
         logger.info(f"Initialized scraper with subdomain: {self.subdomain}")
     
-    def scrape_articles(self, per_page: int = 30) -> Dict[str, Any]:
+    def _fetch_article(self, article_id: int) -> Dict[str, Any]:
+        """Fetch one article body, tracking how many fetches are in flight."""
+        with self._in_flight_lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            return self.client.get_article_content(article_id)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+    
+    @staticmethod
+    def _needs_full_fetch(article: Dict[str, Any]) -> bool:
+        """
+        Check whether a list-endpoint article lacks a usable body.
+        
+        The list payload normally carries the full body; fall back to the
+        single-article endpoint when it is missing, empty or cut off mid-tag.
+        """
+        body = article.get("body")
+        if not isinstance(body, str) or not body.strip():
+            return True
+        # An unclosed trailing tag means the body was truncated
+        return body.rfind("<") > body.rfind(">")
+    
+    def _fetch_job(self, job: Dict[str, Any], trust_list_payload: bool):
+        """Pipeline fetch stage: use the list body or fetch the full article."""
+        article = job["article"]
+        if not trust_list_payload or self._needs_full_fetch(article):
+            job["detail_fetch"] = True
+            job["full_article"] = self._fetch_article(article["id"])
+        else:
+            job["full_article"] = article
+    
+    def _convert_jobs(self, jobs: List[Dict[str, Any]]):
+        """Pipeline convert stage: HTML -> cleaned Markdown and its hash, for a batch of jobs."""
+        todo = []
+        for job in jobs:
+            # Extract HTML body
+            if job["full_article"].get("body"):
+                todo.append(job)
+            else:
+                job["markdown"] = None
+        
+        # Convert HTML to Markdown (in the process pool for large batches)
+        markdowns = self.converter.convert_many([
+            (job["full_article"]["body"], job["full_article"].get("html_url", ""))
+            for job in todo
+        ])
+        for job, markdown in zip(todo, markdowns):
+            job["markdown"] = markdown
+            job["content_hash"] = hashlib.md5(markdown.encode()).hexdigest()
+            job["canonical_hash"] = canonical_hash(markdown)
+            if SIGNIFICANCE_CHECK_ENABLED:
+                job["signature"] = signature(markdown)
+    
+    def _persist_job(self, job: Dict[str, Any], summary: Dict[str, Any]):
+        """Pipeline persist stage: compare hashes, save changed articles and update counts."""
+        i, total = job["index"], job["total"]
+        article = job["article"]
+        if job.get("detail_fetch"):
+            summary["detail_fetches"] += 1
+        
+        if "error" in job:
+            logger.error(f"  [{i}/{total}] Error: {job['error']}")
+            summary["errors"] += 1
+            return
+        
+        if job["markdown"] is None:
+            logger.warning(f"  [{i}/{total}] No body content")
+            summary["skipped"] += 1
+            return
+        
+        full_article = job["full_article"]
+        markdown = job["markdown"]
+        
+        # Check if changed (ignoring cosmetic edits)
+        if self.store.has_changed(article["id"], job["content_hash"], job["canonical_hash"]):
+            # Check before saving so we can distinguish added vs updated
+            old_record = self.store.get_article(article["id"])
+            self.store.save_article(full_article, markdown, canonical_hash=job["canonical_hash"])
+            
+            if self._is_minor_edit(old_record, job):
+                # Saved locally; the vector store copy is refreshed once edits add up or go stale
+                self.store.defer_upload(article["id"], job["signature"])
+                logger.info(f"  [{i}/{total}] Minor edit (upload deferred)")
+                summary["deferred_uploads"] += 1
+            else:
+                self.store.set_upload_baseline(article["id"], job.get("signature"))
+                
+                # Track the documents (article file or changed sections) to upload
+                summary["changed_files"].extend(self.store.upload_documents(article["id"]))
+            
+            if old_record:
+                summary["updated"] += 1
+            else:
+                summary["added"] += 1
+        else:
+            if self.store.has_changed(article["id"], job["content_hash"]):
+                logger.info(f"  [{i}/{total}] Cosmetic changes only (skipped)")
+                summary["canonical_suppressed"] += 1
+            else:
+                logger.info(f"  [{i}/{total}] No changes (skipped)")
+            # Record the new timestamps and hashes so the next run can skip without fetching
+            self.store.touch_article(full_article, job["content_hash"], job["canonical_hash"])
+            summary["skipped"] += 1
+    
+    @staticmethod
+    def _is_minor_edit(old_record: Optional[Dict[str, Any]], job: Dict[str, Any]) -> bool:
+        """Check whether a change is too small (vs the last uploaded version) to upload yet."""
+        if not SIGNIFICANCE_CHECK_ENABLED or "signature" not in job:
+            return False
+        if not old_record or not old_record.get("baseline_sig"):
+            return False
+        return change_fraction(old_record["baseline_sig"], job["signature"]) < SIGNIFICANCE_MIN_CHANGE
+    
+    def _flush_stale_deferrals(self, summary: Dict[str, Any]):
+        """Queue uploads for deferred edits older than SIGNIFICANCE_MAX_STALENESS_HOURS."""
+        max_age = timedelta(hours=SIGNIFICANCE_MAX_STALENESS_HOURS)
+        for article_key in self.store.get_stale_deferrals(max_age):
+            for doc in self.store.upload_documents(article_key):
+                if doc not in summary["changed_files"]:
+                    summary["changed_files"].append(doc)
+            self.store.set_upload_baseline(article_key, self.store.get_article(article_key).get("pending_sig"))
+            summary["stale_flushed"] += 1
+        if summary["stale_flushed"]:
+            logger.info(f"Uploading {summary['stale_flushed']} deferred edits older than "
+                        f"{SIGNIFICANCE_MAX_STALENESS_HOURS}h")
+    
+    def _new_summary(self) -> Dict[str, Any]:
+        """Create an empty scrape summary."""
+        return {
+            "total_fetched": 0,
+            "added": 0,
+            "updated": 0,
+            "skipped": 0,
+            "errors": 0,
+            "changed_files": [],  # Upload documents (article slugs or section paths) to upload
+            "pagination_complete": False,
+            "pages": 0,
+            "max_in_flight": 0,  # Peak concurrent article body fetches
+            "detail_fetches": 0,  # Single-article requests issued
+            "unchanged_by_timestamp": 0,  # Skipped on updated_at/edited_at before fetching
+            "canonical_suppressed": 0,  # Raw Markdown changed but canonical form did not
+            "deferred_uploads": 0,  # Saved locally, upload held back as a minor edit
+            "stale_flushed": 0,  # Deferred edits uploaded because they waited too long
+            "stages": {},  # Per-stage items, busy seconds and utilization
+            "newest_updated_at": None,  # Newest article updated_at seen (unix time), the next incremental cursor
+            "aborted": None  # Reason the run stopped early (progress checkpointed)
+        }
+    
+    def _build_pipeline(self, summary: Dict[str, Any], max_workers: int,
+                        trust_list_payload: bool) -> Pipeline:
+        """
+        Build the fetch -> convert -> persist pipeline for one scrape run.
+        
+        Fetch is network-bound and gets max_workers threads, conversion is
+        CPU-bound and takes whatever has queued up as one batch for the
+        process pool (CONVERT_WORKERS batches at a time), and persist runs on a single
+        ordered thread so state writes, counts and changed_files ordering do
+        not depend on network timing.
+        """
+        return Pipeline([
+            Stage("fetch", lambda job: self._fetch_job(job, trust_list_payload), workers=max_workers),
+            Stage("convert", self._convert_jobs, workers=CONVERT_WORKERS, batch_size=PIPELINE_QUEUE_SIZE),
+            Stage("persist", lambda job: self._persist_job(job, summary), ordered=True),
+        ], queue_size=PIPELINE_QUEUE_SIZE)
+    
+    @staticmethod
+    def _updated_timestamp(article: Dict[str, Any]) -> Optional[int]:
+        """Parse an article's updated_at into a Unix timestamp (None if missing/invalid)."""
+        try:
+            return int(datetime.fromisoformat(article["updated_at"].replace("Z", "+00:00")).timestamp())
+        except (KeyError, AttributeError, ValueError):
+            return None
+    
+    def _process_page(self, articles: List[Dict[str, Any]], summary: Dict[str, Any],
+                      pipeline: Pipeline, force: bool = False):
+        """
+        Fetch, convert and store one page of articles.
+        
+        Articles whose updated_at/edited_at match the stored record are skipped
+        before any fetch or conversion unless force is set. The rest are fed
+        through the run's pipeline; its bounded queues keep at most a few
+        articles buffered between stages.
+        """
+        timestamps = [ts for ts in map(self._updated_timestamp, articles) if ts is not None]
+        if timestamps:
+            summary["newest_updated_at"] = max(timestamps + [summary["newest_updated_at"] or 0])
+        
+        if not force:
+            pending = [article for article in articles if not self.store.is_up_to_date(article)]
+            unchanged = len(articles) - len(pending)
+            if unchanged:
+                logger.info(f"Skipping {unchanged} articles unchanged since last run (updated_at)")
+            summary["unchanged_by_timestamp"] += unchanged
+            summary["skipped"] += unchanged
+            articles = pending
+        
+        logger.info(f"Processing {len(articles)} articles "
+                    f"(fetch={pipeline.stages[0].workers}, convert={pipeline.stages[1].workers})...\n")
+        self._in_flight = 0
+        self._max_in_flight = 0
+        pipeline.run(
+            {"index": i, "total": len(articles), "article": article}
+            for i, article in enumerate(articles, 1)
+        )
+        
+        summary["max_in_flight"] = max(summary["max_in_flight"], self._max_in_flight)
+        summary["stages"] = pipeline.stats()
+    
+    def _finish(self, summary: Dict[str, Any], client=None) -> Dict[str, Any]:
+        """Finalize storage and log the scrape summary."""
+        self._flush_stale_deferrals(summary)
+        self.store.finalize()
+        self.converter.shutdown()
+        client = client or self.client
+        summary.update(client.cache_stats())
+        summary.update(client.throttle_stats())
+        summary.update(client.resilience_stats())
+        summary.update(self.converter.stats())
+        
+        logger.info("\n" + "="*50)
+        logger.info("Scrape summary:")
+        logger.info(f"Pages: {summary['pages']}")
+        logger.info(f"Total fetched: {summary['total_fetched']}")
+        logger.info(f"Added: {summary['added']}")
+        logger.info(f"Updated: {summary['updated']}")
+        logger.info(f"Skipped: {summary['skipped']} ({summary['unchanged_by_timestamp']} by timestamp, "
+                    f"{summary['canonical_suppressed']} cosmetic)")
+        logger.info(f"Uploads deferred (minor edits): {summary['deferred_uploads']} "
+                    f"(stale flushed: {summary['stale_flushed']})")
+        logger.info(f"Errors: {summary['errors']}")
+        logger.info(f"Detail fetches: {summary['detail_fetches']}")
+        logger.info(f"Max fetches in flight: {summary['max_in_flight']}")
+        logger.info(f"Converted in pool/in-process: {summary['pool_conversions']}/{summary['inline_conversions']} "
+                    f"(conversion cache hits: {summary['conversion_cache_hits']})")
+        logger.info(f"HTTP cache hits/misses: {summary['http_cache_hits']}/{summary['http_cache_misses']}")
+        logger.info(f"Throttled: {summary['throttled']} (retries: {summary['throttle_retries']}, "
+                    f"waited: {summary['throttle_wait_seconds']}s, "
+                    f"concurrency: {summary['min_concurrency']}-{summary['max_concurrency']})")
+        logger.info(f"Transient retries: {summary['transient_retries']} (circuit: {summary['circuit_state']})")
+        for name, stage in summary["stages"].items():
+            logger.info(f"Stage {name}: {stage['items']} items, {stage['workers']} workers, "
+                        f"utilization {stage['utilization']:.0%}")
+        if summary["aborted"]:
+            logger.warning(f"Stopped early: {summary['aborted']}")
+        logger.info("="*50 + "\n")
+        
+        return summary
+    
+    def _checkpoint(self, summary: Dict[str, Any], error: Exception,
+                    page_url: Optional[str] = None, full_crawl: bool = False):
+        """
+        Record an early stop so the next run resumes instead of starting over.
+        
+        Page mode keeps next_page_url pointing at the unfinished page; a full
+        crawl stores the page it was on as crawl_checkpoint.
+        """
+        summary["aborted"] = str(error)[:200]
+        if full_crawl:
+            self.store.set_crawl_checkpoint(page_url)
+        logger.warning(f"Stopping early ({error}) - progress checkpointed, next run resumes from this page")
+    
+    def scrape_articles(self, per_page: int = 30, max_workers: int = FETCH_MAX_WORKERS,
+                        trust_list_payload: bool = TRUST_LIST_PAYLOAD,
+                        full_crawl: bool = False, force: bool = FORCE_REFRESH) -> Dict[str, Any]:
         """
         Scrape, convert, and store articles using pagination.
         Automatically loads next_page_url from state and continues from there.
         
+        In full-crawl mode every page is walked in a single run at the largest
+        page size Zendesk allows, and page N+1 is fetched in the background
+        while page N's articles are processed.
+        
+        If a page cannot be fetched after retries, or the circuit breaker opens,
+        the run stops early with its progress checkpointed instead of failing.
+        
         Args:
             per_page: Number of articles to fetch per batch (default 30)
+            max_workers: Maximum concurrent article body fetches (1 = sequential)
+            trust_list_payload: Convert bodies straight from the list response and
+                only call the single-article endpoint when a body is missing/truncated
+            full_crawl: Walk all pages from the beginning instead of one page per run
+            force: Fetch and re-hash every article even if its timestamps are unchanged
             
         Returns:
             Summary dict with counts (added, updated, skipped) and changed_files list
         """
-        # Load pagination state
-        next_page_url = self.store.get_next_page_url()
-        
-        if next_page_url:
-            logger.info(f"Continuing pagination from saved position...")
+        if full_crawl:
+            # Resume an interrupted crawl from its checkpoint, if any
+            next_page_url = self.store.get_crawl_checkpoint()
+            per_page = ZENDESK_MAX_PER_PAGE
+            if next_page_url:
+                logger.info(f"Resuming full crawl from checkpoint (per_page={per_page})...")
+            else:
+                logger.info(f"Starting full crawl (per_page={per_page})...")
         else:
-            logger.info(f"Starting fresh pagination (fetching {per_page} articles)...")
+            # Load pagination state
+            next_page_url = self.store.get_next_page_url()
+            
+            if next_page_url:
+                logger.info(f"Continuing pagination from saved position...")
+            else:
+                logger.info(f"Starting fresh pagination (fetching {per_page} articles)...")
         
-        summary = {
-            "total_fetched": 0,
-            "added": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": 0,
-            "changed_files": [],  # Track slugs of new/updated files
-            "pagination_complete": False
-        }
+        summary = self._new_summary()
+        pipeline = self._build_pipeline(summary, max_workers, trust_list_payload)
         
         try:
-            # Fetch articles from Zendesk with pagination
-            articles, new_next_page_url = self.client.get_articles(
-                next_page_url=next_page_url,
-                per_page=per_page
-            )
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                page_url = next_page_url
+                page_future = prefetcher.submit(
+                    self.client.get_articles,
+                    next_page_url=next_page_url,
+                    per_page=per_page
+                )
+                
+                while page_future is not None:
+                    try:
+                        articles, new_next_page_url = page_future.result()
+                    except (CircuitOpenError, requests.exceptions.RequestException) as e:
+                        self._checkpoint(summary, e, page_url, full_crawl)
+                        break
+                    summary["pages"] += 1
+                    summary["total_fetched"] += len(articles)
+                    
+                    # Prefetch the next page while this one is processed
+                    page_future = None
+                    if full_crawl and new_next_page_url:
+                        page_future = prefetcher.submit(
+                            self.client.get_articles,
+                            next_page_url=new_next_page_url,
+                            per_page=per_page
+                        )
+                    
+                    self._process_page(articles, summary, pipeline, force)
+                    
+                    if self.breaker.is_open:
+                        # Articles on this page failed fast; redo it next run
+                        self._checkpoint(summary, CircuitOpenError("circuit opened while processing page"),
+                                         page_url, full_crawl)
+                        break
+                    
+                    if not full_crawl:
+                        # Save new pagination state
+                        self.store.set_next_page_url(new_next_page_url)
+                    page_url = new_next_page_url
+                    
+                    if new_next_page_url is None:
+                        summary["pagination_complete"] = True
+                        logger.info("Pagination cycle complete - will restart from beginning next run")
             
-            summary["total_fetched"] = len(articles)
+            if full_crawl and not summary["aborted"]:
+                # A full crawl covers every page; restart page-mode runs from the top
+                self.store.set_next_page_url(None)
+                self.store.set_crawl_checkpoint(None)
             
-            # Save new pagination state
-            self.store.set_next_page_url(new_next_page_url)
+            return self._finish(summary)
+        
+        except Exception as e:
+            logger.error(f"Error during scraping: {e}")
+            raise
+    
+    def scrape_incremental(self, max_workers: int = FETCH_MAX_WORKERS,
+                           trust_list_payload: bool = TRUST_LIST_PAYLOAD,
+                           force: bool = FORCE_REFRESH) -> Dict[str, Any]:
+        """
+        Sync only articles changed since the last successful run.
+        
+        Walks the public article list, which is sorted by updated_at (newest
+        first), and stops at the first page reaching back past the persisted
+        cursor, so no API credentials are needed. Until a full crawl has
+        completed without errors there is no cursor, and each run crawls
+        (resuming an aborted crawl) instead. The cursor only advances when
+        every article was stored, so failed articles are pulled again next run.
+        
+        Args:
+            max_workers: Maximum concurrent article body fetches
+            trust_list_payload: Convert bodies straight from the list response
+            force: Fetch and re-hash every article even if its timestamps are unchanged
             
-            if new_next_page_url is None:
-                summary["pagination_complete"] = True
-                logger.info("Pagination cycle complete - will restart from beginning next run")
-
-            # Fetch full content and convert each
-            logger.info("Processing articles...\n")
-            for i, article in enumerate(articles, 1):
-                try:
-                    full_article = self.client.get_article_content(article["id"])
+        Returns:
+            Summary dict with counts (added, updated, skipped) and changed_files list
+        """
+        start_time = self.store.get_incremental_cursor()
+        if start_time is None:
+            logger.info("No incremental cursor yet - running full crawl to seed incremental sync")
+            summary = self.scrape_articles(max_workers=max_workers,
+                                           trust_list_payload=trust_list_payload,
+                                           full_crawl=True, force=force)
+            if summary["aborted"] or summary["errors"]:
+                # Leave the cursor unset so the next run crawls again (resuming from its checkpoint)
+                logger.warning("Seed crawl incomplete - incremental cursor not set")
+            else:
+                # Zendesk's own timestamps, so clock skew between hosts cannot skip edits
+                self.store.set_incremental_cursor(summary["newest_updated_at"] or int(time.time()))
+            return summary
+        
+        logger.info(f"Starting incremental sync from {datetime.fromtimestamp(start_time).isoformat()}...")
+        summary = self._new_summary()
+        pipeline = self._build_pipeline(summary, max_workers, trust_list_payload)
+        
+        try:
+            next_page_url = None
+            while True:
+                articles, next_page_url = self.client.get_articles(
+                    next_page_url=next_page_url,
+                    per_page=ZENDESK_MAX_PER_PAGE
+                )
+                summary["pages"] += 1
+                
+                # Keep articles at or after the cursor; an equal timestamp is re-read
+                # and skipped by the timestamp check, so nothing updated in the same second is lost
+                changed = []
+                reached_cursor = False
+                for article in articles:
+                    updated = self._updated_timestamp(article)
+                    if updated is not None and updated < start_time:
+                        reached_cursor = True
+                        continue
+                    changed.append(article)
+                
+                summary["total_fetched"] += len(changed)
+                self._process_page(changed, summary, pipeline, force)
+                if self.breaker.is_open:
+                    raise CircuitOpenError("circuit opened while processing page")
+                
+                if reached_cursor or not next_page_url:
+                    break
+            
+            summary["pagination_complete"] = True
+            if summary["errors"]:
+                logger.warning(f"{summary['errors']} articles failed - keeping incremental cursor at {start_time}")
+            else:
+                self.store.set_incremental_cursor(max(start_time, summary["newest_updated_at"] or 0))
+            return self._finish(summary)
+        
+        except (CircuitOpenError, requests.exceptions.RequestException) as e:
+            # Cursor was not advanced, so the next run re-reads this window
+            self._checkpoint(summary, e)
+            return self._finish(summary)
+        
+        except Exception as e:
+            logger.error(f"Error during incremental sync: {e}")
+            raise
+    
+    async def _drain_async_batch(self, batch: List[tuple], summary: Dict[str, Any]):
+        """Await queued body fetches, convert them as one batch and store them in list order."""
+        jobs = []
+        for i, (article, task) in enumerate(batch, 1):
+            job = {"index": i, "total": len(batch), "article": article}
+            try:
+                job["full_article"] = await task if task is not None else article
+            except Exception as e:
+                job["error"] = e
+            jobs.append(job)
+        
+        # Convert off the event loop so in-flight fetches keep making progress
+        fetched = [job for job in jobs if "error" not in job]
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._convert_jobs, fetched)
+        except Exception as e:
+            for job in fetched:
+                job.setdefault("error", e)
+        
+        for job in jobs:
+            self._persist_job(job, summary)
+    
+    async def scrape_articles_async(self, per_page: int = ZENDESK_MAX_PER_PAGE,
+                                    max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+                                    trust_list_payload: bool = TRUST_LIST_PAYLOAD,
+                                    force: bool = FORCE_REFRESH) -> Dict[str, Any]:
+        """
+        Crawl every page with AsyncZendeskClient and store changed articles.
+        
+        Body fetches are scheduled as tasks as soon as an article is yielded,
+        so up to max_concurrency requests overlap across page boundaries.
+        Results are converted and stored in list order, one page-sized batch
+        at a time, which keeps memory bounded and counts deterministic. Like
+        the threaded full crawl, it resumes from and writes crawl_checkpoint.
+        
+        Args:
+            per_page: Number of articles per page (default: the API maximum)
+            max_concurrency: Maximum requests in flight
+            trust_list_payload: Convert bodies straight from the list response
+            force: Fetch and re-hash every article even if its timestamps are unchanged
+            
+        Returns:
+            Summary dict with counts (added, updated, skipped) and changed_files list
+        """
+        checkpoint = self.store.get_crawl_checkpoint()
+        logger.info(f"{'Resuming' if checkpoint else 'Starting'} async crawl "
+                    f"(per_page={per_page}, max_concurrency={max_concurrency})...")
+        summary = self._new_summary()
+        
+        client = AsyncZendeskClient(subdomain=self.subdomain, max_concurrency=max_concurrency,
+                                    limiter=self.limiter, retry=self.retry, breaker=self.breaker)
+        batch = []
+        
+        try:
+            async with client:
+                async for article in client.get_articles(per_page=per_page, next_page_url=checkpoint):
+                    summary["total_fetched"] += 1
                     
-                    # Extract HTML body
-                    html_body = full_article.get("body", "")
-                    if not html_body:
-                        logger.warning(f"  [{i}/{len(articles)}] No body content")
+                    if not force and self.store.is_up_to_date(article):
+                        summary["unchanged_by_timestamp"] += 1
                         summary["skipped"] += 1
                         continue
                     
-                    # Convert HTML to Markdown
-                    markdown = html_to_markdown(
-                        html_body,
-                        base_url=full_article.get("html_url", "")
-                    )
-                    markdown = clean_markdown(markdown)
-                    
-                    # Check if changed
-                    content_hash = hashlib.md5(markdown.encode()).hexdigest()
+                    task = None
+                    if not trust_list_payload or self._needs_full_fetch(article):
+                        task = asyncio.create_task(client.get_article_content(article["id"]))
+                        summary["detail_fetches"] += 1
+                    batch.append((article, task))
                     
-                    if self.store.has_changed(article["id"], content_hash):
-                        # Check before saving so we can distinguish added vs updated
-                        old_record = self.store.get_article(article["id"])
-                        self.store.save_article(full_article, markdown)
-                        
-                        # Get slug for changed file tracking
-                        new_record = self.store.get_article(article["id"])
-                        if new_record and new_record.get("slug"):
-                            summary["changed_files"].append(new_record["slug"])
-                        
-                        if old_record:
-                            summary["updated"] += 1
-                        else:
-                            summary["added"] += 1
-                    else:
-                        logger.info(f"  [{i}/{len(articles)}] No changes (skipped)")
-                        summary["skipped"] += 1
+                    if len(batch) >= per_page:
+                        await self._drain_async_batch(batch, summary)
+                        batch = []
                 
-                except Exception as e:
-                    logger.error(f"  [{i}/{len(articles)}] Error: {e}")
-                    summary["errors"] += 1
-                    continue
-            
-            # Finalize storage
-            self.store.finalize()
+                await self._drain_async_batch(batch, summary)
+                
+                summary["pages"] = client.pages_fetched
+                summary["max_in_flight"] = client.max_in_flight
+                summary["pagination_complete"] = True
             
-            # Print summary
-            logger.info("\n" + "="*50)
-            logger.info("Scrape summary:")
-            logger.info(f"Total fetched: {summary['total_fetched']}")
-            logger.info(f"Added: {summary['added']}")
-            logger.info(f"Updated: {summary['updated']}")
-            logger.info(f"Skipped: {summary['skipped']}")
-            logger.info(f"Errors: {summary['errors']}")
-            logger.info("="*50 + "\n")
+            # A full crawl covers every page; restart page-mode runs from the top
+            self.store.set_next_page_url(None)
+            self.store.set_crawl_checkpoint(None)
             
-            return summary
+            return self._finish(summary, client=client)
+        
+        except (CircuitOpenError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Pending body fetches are abandoned; resume from the page being read
+            for _, task in batch:
+                if task is not None:
+                    task.cancel()
+            summary["pages"] = client.pages_fetched
+            summary["max_in_flight"] = client.max_in_flight
+            self._checkpoint(summary, e, client.current_page_url, full_crawl=True)
+            return self._finish(summary, client=client)
         
         except Exception as e:
-            logger.error(f"Error during scraping: {e}")
+            logger.error(f"Error during async scraping: {e}")
             raise
 
 
-def scrape_all_articles(per_page: int = 30) -> Dict[str, Any]:
+def scrape_all_articles(per_page: int = 30, max_workers: int = FETCH_MAX_WORKERS,
+                        full_crawl: bool = False) -> Dict[str, Any]:
     """
     Function to scrape articles using pagination.
     
     Args:
         per_page: Number of articles to fetch per batch (default 30)
+        max_workers: Maximum concurrent article body fetches
+        full_crawl: Walk every page in a single run
         
     Returns:
         Summary dict
     """
     scraper = ArticleScraper()
-    return scraper.scrape_articles(per_page=per_page)
+    return scraper.scrape_articles(per_page=per_page, max_workers=max_workers, full_crawl=full_crawl)
 
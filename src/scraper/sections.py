@@ -0,0 +1,55 @@
+"""Split article Markdown into heading-delimited sections."""
+
+import re
+from typing import Dict, List
+
+from slugify import slugify
+
+from config import SECTION_SPLIT_LEVEL
+
+_HEADING_RE = re.compile(r'^(#{1,6}) +(.*?)\s*$')
+_FENCE = '```'
+
+
+def split_sections(markdown: str, max_level: int = SECTION_SPLIT_LEVEL) -> List[Dict[str, str]]:
+    """
+    Split Markdown at headings of level <= max_level (outside code fences).
+
+    Text before the first heading becomes an "intro" section. Keys come from
+    the heading text (numbered on repeats), so inserting or editing one
+    section leaves the other sections' keys and contents unchanged.
+
+    Args:
+        markdown: Article Markdown
+        max_level: Deepest heading level that starts a new section
+
+    Returns:
+        Sections as dicts with key, heading and content (heading line included)
+    """
+    sections = []
+    heading = ""
+    lines: List[str] = []
+    in_fence = False
+
+    def close():
+        content = "\n".join(lines).strip()
+        if content:
+            sections.append({"heading": heading, "content": content})
+
+    for line in markdown.split("\n"):
+        if line.lstrip().startswith(_FENCE):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match and len(match.group(1)) <= max_level:
+            close()
+            heading = match.group(2)
+            lines = []
+        lines.append(line)
+    close()
+
+    seen: Dict[str, int] = {}
+    for section in sections:
+        base = slugify(section["heading"], max_length=40) or "intro"
+        seen[base] = seen.get(base, 0) + 1
+        section["key"] = base if seen[base] == 1 else f"{base}-{seen[base]}"
+    return sections
@@ -0,0 +1,58 @@
+"""Estimate how much an article changed using compact shingle sketches."""
+
+import heapq
+import hashlib
+from typing import List
+
+SHINGLE_WORDS = 5  # Words per shingle
+SKETCH_SIZE = 64  # Smallest shingle hashes kept per document (bottom-k sketch)
+
+
+def _shingles(text: str, size: int = SHINGLE_WORDS) -> set:
+    words = text.split()
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def signature(markdown: str, k: int = SKETCH_SIZE) -> List[int]:
+    """
+    Build a bottom-k sketch of a document's word shingles.
+
+    The sketch is a sorted list of at most k 32-bit hashes, small enough to
+    keep in the state file for every article.
+
+    Args:
+        markdown: Document text
+        k: Number of hashes kept
+
+    Returns:
+        Sorted shingle hashes
+    """
+    hashes = {
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=4).digest(), "big")
+        for shingle in _shingles(markdown)
+    }
+    return heapq.nsmallest(k, hashes)
+
+
+def similarity(old: List[int], new: List[int], k: int = SKETCH_SIZE) -> float:
+    """
+    Estimate the Jaccard similarity of two documents from their sketches.
+
+    Exact when both documents have fewer than k shingles.
+
+    Returns:
+        Similarity between 0.0 (disjoint) and 1.0 (same shingles)
+    """
+    if not old and not new:
+        return 1.0
+    old_set, new_set = set(old), set(new)
+    union = heapq.nsmallest(k, old_set | new_set)
+    shared = sum(1 for h in union if h in old_set and h in new_set)
+    return shared / len(union)
+
+
+def change_fraction(old: List[int], new: List[int]) -> float:
+    """Estimate the fraction of shingles that changed between two sketches."""
+    return 1.0 - similarity(old, new)
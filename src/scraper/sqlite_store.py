@@ -0,0 +1,269 @@
+"""SQLite-backed article state with indexed lookups."""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import config
+
+from .article_store import ArticleStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    slug TEXT,
+    hash TEXT,
+    updated_at TEXT,
+    pending_since TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug);
+CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(hash);
+CREATE INDEX IF NOT EXISTS idx_articles_updated_at ON articles(updated_at);
+CREATE INDEX IF NOT EXISTS idx_articles_pending ON articles(pending_since) WHERE pending_since IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS uploads (
+    file_id TEXT PRIMARY KEY,
+    article_id TEXT,
+    doc TEXT,
+    status TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_uploads_doc ON uploads(doc);
+CREATE INDEX IF NOT EXISTS idx_uploads_status ON uploads(status);
+"""
+
+
+class SQLiteArticleStore(ArticleStore):
+    """
+    ArticleStore keeping state in a local SQLite database (WAL mode).
+
+    Records are read and written one at a time through indexed queries
+    instead of holding the whole state in memory. Every write is committed
+    as soon as it is made, even inside batch(), so no write transaction
+    stays open across a run and other processes can read and write the
+    database while a run is going. In WAL mode with synchronous=NORMAL a
+    commit does not fsync, so this costs little.
+
+    On first open the database is filled from the JSON state (Spaces or
+    state.json), so switching backends keeps cursors, ids and hashes.
+    """
+
+    def __init__(self, articles_dir: str = "data/articles", state_file: str = "data/state.json",
+                 use_spaces: bool = True, granularity: str = config.UPLOAD_GRANULARITY,
+                 db_path: str = str(config.STATE_DB)):
+        """
+        Initialize SQLite article store.
+
+        Args:
+            articles_dir: Directory to store markdown files
+            state_file: JSON state file migrated into the database on first open
+            use_spaces: Read Spaces state for the one-time migration
+            granularity: "article" or "section" (see ArticleStore)
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        super().__init__(articles_dir=articles_dir, state_file=state_file,
+                         use_spaces=use_spaces, granularity=granularity)
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Open the database, creating the schema and migrating JSON state on first use."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from the pipeline's persist thread as well; access is serialized by _lock
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.executescript(_SCHEMA)
+
+        if self._get_meta("schema_version") is None:
+            self._migrate_from_json()
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                              ("schema_version", json.dumps(SCHEMA_VERSION)))
+            self.conn.commit()
+
+        logger.info(f"Opened SQLite state: {self.db_path} ({self._count_records()} articles)")
+        return {}
+
+    def _migrate_from_json(self):
+        """Copy JSON state (Spaces or local state.json) into the empty database."""
+        state = super()._load_state()
+        articles = state.pop("articles", {})
+        orphans = state.pop("orphaned_file_ids", [])
+        if not articles and not any(state.values()):
+            return
+
+        for name, value in state.items():
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                              (name, json.dumps(value)))
+        for article_key, record in articles.items():
+            self._write_record(article_key, record)
+            for doc, file_ids in self._record_uploads_of(record):
+                self._write_uploads(article_key, doc, file_ids)
+        self._write_orphans(orphans)
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                          ("migrated_at", json.dumps(datetime.now().isoformat())))
+        logger.info(f"Migrated {len(articles)} articles from JSON state into {self.db_path}")
+
+    @staticmethod
+    def _record_uploads_of(record: Dict[str, Any]):
+        if record.get("file_ids"):
+            yield record["slug"], record["file_ids"]
+        for section in record.get("sections", {}).values():
+            if section.get("file_ids"):
+                yield section["doc"], section["file_ids"]
+
+    def _save_state(self):
+        """Nothing to save: every write is committed as it is made."""
+
+    def _commit(self):
+        """Commit the current write; caller holds _lock."""
+        try:
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"Error committing state to {self.db_path}: {e}")
+            raise
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self.conn.close()
+
+    def _write_record(self, article_key: str, record: Dict[str, Any]):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO articles (id, slug, hash, updated_at, pending_since, record) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (article_key, record.get("slug"), record.get("hash"), record.get("updated_at"),
+             record.get("pending_since"), json.dumps(record))
+        )
+
+    def _get_record(self, article_key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute("SELECT record FROM articles WHERE id = ?", (article_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _put_record(self, article_key: str, record: Dict[str, Any]):
+        with self._lock:
+            self._write_record(article_key, record)
+            self._commit()
+
+    def _iter_records(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT id, record FROM articles ORDER BY id").fetchall()
+        for article_key, record in rows:
+            yield article_key, json.loads(record)
+
+    def _count_records(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def _iter_pending(self):
+        with self._lock:
+            return iter(self.conn.execute(
+                "SELECT id, pending_since FROM articles WHERE pending_since IS NOT NULL"
+            ).fetchall())
+
+    def _get_meta(self, name: str) -> Any:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_meta(self, name: str, value: Any):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                              (name, json.dumps(value)))
+            self._commit()
+
+    def _write_orphans(self, file_ids: List[str]):
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "INSERT INTO uploads (file_id, status, recorded_at) VALUES (?, 'orphaned', ?) "
+            "ON CONFLICT(file_id) DO UPDATE SET status = 'orphaned', recorded_at = excluded.recorded_at",
+            [(file_id, now) for file_id in file_ids]
+        )
+
+    def _orphan(self, file_ids: Optional[List[str]]):
+        if not file_ids:
+            return
+        with self._lock:
+            self._write_orphans(file_ids)
+            self._commit()
+
+    def _take_orphans(self) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute("SELECT file_id FROM uploads WHERE status = 'orphaned'").fetchall()
+            self.conn.execute("DELETE FROM uploads WHERE status = 'orphaned'")
+            self._commit()
+        return [row[0] for row in rows]
+
+    def _write_uploads(self, article_key: str, doc: str, file_ids: List[str]):
+        self.conn.execute("DELETE FROM uploads WHERE doc = ? AND status = 'active'", (doc,))
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO uploads (file_id, article_id, doc, status, recorded_at) "
+            "VALUES (?, ?, ?, 'active', ?)",
+            [(file_id, article_key, doc, now) for file_id in file_ids]
+        )
+
+    def _on_uploaded(self, article_key: str, doc: str, file_ids: List[str]):
+        with self._lock:
+            self._write_uploads(article_key, doc, file_ids)
+            self._commit()
+
+    def _build_doc_index(self):
+        """Documents are located through the slug index instead of an in-memory map."""
+
+    def _index_record(self, article_key: str, record: Dict[str, Any]):
+        pass
+
+    def _unindex_record(self, record: Dict[str, Any]):
+        pass
+
+    def _locate_doc(self, doc: str) -> Optional[tuple]:
+        # "<slug>" or "sections/<slug>--<section key>"; slugify never emits "--"
+        section_key = None
+        slug = doc
+        if doc.startswith("sections/"):
+            slug, _, section_key = doc[len("sections/"):].partition("--")
+        with self._lock:
+            rows = self.conn.execute("SELECT id, record FROM articles WHERE slug = ?", (slug,)).fetchall()
+        for article_key, record in rows:
+            if section_key is None:
+                return article_key, None
+            section = json.loads(record).get("sections", {}).get(section_key)
+            if section and section["doc"] == doc:
+                return article_key, section_key
+        return None
+
+    def find_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get the record of the article stored under a slug."""
+        with self._lock:
+            row = self.conn.execute("SELECT record FROM articles WHERE slug = ?", (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_hash(self, content_hash: str) -> List[str]:
+        """Get IDs of articles whose content has the given hash."""
+        with self._lock:
+            rows = self.conn.execute("SELECT id FROM articles WHERE hash = ?", (content_hash,)).fetchall()
+        return [row[0] for row in rows]
+
+    def updated_since(self, timestamp: str) -> List[str]:
+        """Get IDs of articles whose updated_at is at or after an ISO timestamp."""
+        with self._lock:
+            rows = self.conn.execute("SELECT id FROM articles WHERE updated_at >= ? ORDER BY updated_at",
+                                     (timestamp,)).fetchall()
+        return [row[0] for row in rows]
@@ -1,9 +1,16 @@
 """Zendesk API client for fetching public Help Center articles (no auth required)."""
 
+import json
+import time
 import requests
 import logging
 from typing import List, Dict, Any, Optional
-from config import ZENDESK_SUBDOMAIN
+from requests.adapters import HTTPAdapter
+from config import ZENDESK_SUBDOMAIN, FETCH_MAX_WORKERS, HTTP_CACHE_ENABLED
+
+from .http_cache import HTTPCache
+from .rate_limiter import AdaptiveLimiter
+from .resilience import RetryPolicy, CircuitBreaker, RETRYABLE_STATUSES
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +21,20 @@ class ZendeskClient:
     No authentication required for public Help Centers.
     """
     
-    def __init__(self, subdomain: str = "", api_key: str = ''):
+    def __init__(self, subdomain: str = "", api_key: str = '', pool_maxsize: int = FETCH_MAX_WORKERS,
+                 use_cache: bool = HTTP_CACHE_ENABLED, limiter: Optional[AdaptiveLimiter] = None,
+                 retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
         """
         Initialize Zendesk client for public Help Center API.
         
         Args:
             subdomain: Zendesk subdomain (e.g., "support.optisigns" for support.optisigns.com)
             api_key: Not required for public Help Centers 
+            pool_maxsize: Keep-alive connections kept per host (match the fetch worker count)
+            use_cache: Revalidate list pages and articles against the on-disk HTTP cache
+            limiter: Shared adaptive concurrency limiter (one is created if not provided)
+            retry: Backoff policy for transient failures (one is created if not provided)
+            breaker: Shared circuit breaker (one is created if not provided)
         """
         # Load from config if not provided
         if subdomain == '':
@@ -32,6 +46,116 @@ class ZendeskClient:
         self.session.headers.update({
             "Accept": "application/json",
         })
+        # Size the connection pool so concurrent fetches reuse keep-alive sockets
+        # (+1 for the background page prefetch in full-crawl mode)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_maxsize) + 1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.cache: Optional[HTTPCache] = HTTPCache() if use_cache else None
+        self.limiter = limiter or AdaptiveLimiter(initial=pool_maxsize, max_limit=pool_maxsize + 1)
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+    
+    def _send(self, url: str, params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        GET through the shared limiter and circuit breaker.
+        
+        Throttled (429) responses are retried after Retry-After. Timeouts,
+        connection errors and 5xx responses are retried with jittered backoff.
+        Raises CircuitOpenError when the breaker refuses the call.
+        """
+        throttled = 0
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=10)
+                error = None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                response = None
+                error = e
+            finally:
+                self.limiter.release()
+            
+            if response is not None and response.status_code == 429:
+                # The host is up, just busy: pause every caller until the window reopens
+                self.breaker.record_success()
+                self.limiter.on_throttle(response.headers)
+                if throttled < self.limiter.max_retries:
+                    throttled += 1
+                    self.limiter.record_retry()
+                    continue
+                return response
+            
+            if error is None and response.status_code not in RETRYABLE_STATUSES:
+                self.breaker.record_success()
+                if response.status_code < 400:
+                    self.limiter.on_success(response.headers)
+                return response
+            
+            self.breaker.record_failure()
+            if attempt >= self.retry.max_retries:
+                if error is not None:
+                    raise error
+                return response
+            
+            delay = self.retry.backoff(attempt)
+            attempt += 1
+            reason = error or f"HTTP {response.status_code}"
+            logger.warning(f"Transient failure ({reason}), retry {attempt}/{self.retry.max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+    
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  cacheable: bool = True) -> Dict[str, Any]:
+        """
+        GET a JSON resource, revalidating against the HTTP cache when enabled.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            cacheable: Whether the response may be served from / stored in the cache
+            
+        Returns:
+            Parsed JSON body
+        """
+        if not (cacheable and self.cache):
+            response = self._send(url, params=params)
+            response.raise_for_status()
+            return response.json()
+        
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        entry = self.cache.get(full_url)
+        response = self._send(full_url, headers=HTTPCache.conditional_headers(entry))
+        
+        if response.status_code == 304 and entry:
+            self.cache.record_hit()
+            return json.loads(entry["body"])
+        
+        response.raise_for_status()
+        self.cache.record_miss()
+        self.cache.store(
+            full_url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            body=response.text
+        )
+        return response.json()
+    
+    def throttle_stats(self) -> Dict[str, Any]:
+        """Get rate-limit statistics from the shared limiter."""
+        return self.limiter.stats()
+    
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Get retry and circuit breaker statistics."""
+        return {**self.retry.stats(), **self.breaker.stats()}
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Get HTTP cache hit/miss counters (zeros when caching is disabled)."""
+        if not self.cache:
+            return {"http_cache_hits": 0, "http_cache_misses": 0, "http_cache_evicted": 0}
+        return self.cache.stats()
     
     def get_articles(self, next_page_url: Optional[str] = None, per_page: int = 30) -> tuple[List[Dict[str, Any]], Optional[str]]:
         """
@@ -50,7 +174,7 @@ class ZendeskClient:
                 url = next_page_url
                 logger.info(f"Fetching articles from next_page URL...")
                 logger.debug(f"   URL: {next_page_url}")
-                response = self.session.get(url, timeout=10)
+                data = self._get_json(url)
             else:
                 # First request - build URL with defaults
                 url = f"{self.base_url}/help_center/en-us/articles"
@@ -62,10 +186,7 @@ class ZendeskClient:
                 logger.info(f"Fetching articles (first page, per_page={per_page})...")
                 logger.debug(f"   URL: {url}")
                 logger.debug(f"   Params: {params}")
-                response = self.session.get(url, params=params, timeout=10)
-            
-            response.raise_for_status()
-            data = response.json()
+                data = self._get_json(url, params=params)
             
             articles = data.get("articles", [])
             next_page = data.get("next_page")  # This is the full URL or None
@@ -94,10 +215,7 @@ class ZendeskClient:
         """
         try:
             url = f"{self.base_url}/help_center/en-us/articles/{article_id}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            return response.json().get("article", {})
+            return self._get_json(url).get("article", {})
         
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching article {article_id}: {e}")
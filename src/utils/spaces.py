@@ -2,16 +2,20 @@
 
 import json
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, ParamValidationError
 
 import config
 
 logger = logging.getLogger(__name__)
 
 
+class PreconditionFailedError(Exception):
+    """A conditional write failed: the object changed (or appeared) since it was read."""
+
+
 class SpacesClient:
     """Thin wrapper around boto3 S3 client for Spaces."""
 
@@ -20,6 +24,7 @@ class SpacesClient:
             raise ValueError("Spaces is not enabled; missing credentials or config")
 
         self.bucket = config.SPACES_BUCKET
+        self.conditional_writes = config.SPACES_CONDITIONAL_WRITES
         self.client = boto3.client(
             "s3",
             endpoint_url=config.SPACES_ENDPOINT,
@@ -42,6 +47,109 @@ class SpacesClient:
             logger.warning(f"Spaces download failed for {key}: {e}")
             return None
 
+    def download_bytes(self, key: str) -> Optional[bytes]:
+        """Download an object's raw bytes. Returns None if not found."""
+        try:
+            obj = self.client.get_object(Bucket=self.bucket, Key=key)
+            return obj["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+                return None
+            logger.warning(f"Spaces download failed for {key}: {e}")
+            return None
+        except Exception as e:  # pragma: no cover - defensive
+            logger.warning(f"Spaces download failed for {key}: {e}")
+            return None
+
+    def download_bytes_if_changed(self, key: str, etag: Optional[str]) -> Tuple[str, Optional[bytes], Optional[str]]:
+        """
+        Conditionally download an object (If-None-Match).
+        
+        Args:
+            key: Object key
+            etag: ETag of the cached copy (None downloads unconditionally)
+            
+        Returns:
+            (status, body, etag) where status is "ok" (body downloaded),
+            "not_modified" (cached copy is current), "missing" or "error"
+        """
+        params = {"Bucket": self.bucket, "Key": key}
+        if etag:
+            params["IfNoneMatch"] = etag
+        try:
+            obj = self.client.get_object(**params)
+            return "ok", obj["Body"].read(), obj.get("ETag")
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in {"304", "NotModified"} or \
+                    e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304:
+                return "not_modified", None, etag
+            if code in {"NoSuchKey", "404"}:
+                return "missing", None, None
+            logger.warning(f"Spaces download failed for {key}: {e}")
+            return "error", None, None
+        except Exception as e:  # pragma: no cover - defensive
+            logger.warning(f"Spaces download failed for {key}: {e}")
+            return "error", None, None
+
+    def head_etag(self, key: str) -> Optional[str]:
+        """Get an object's ETag without downloading it. Returns None if not found."""
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key).get("ETag")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"NoSuchKey", "404", "NotFound"}:
+                return None
+            raise
+
+    def upload_bytes(self, key: str, body: bytes, content_type: str = "application/octet-stream",
+                     content_encoding: str = "", public: bool = True,
+                     if_match: Optional[str] = None, if_none_match: Optional[str] = None) -> Optional[str]:
+        """
+        Upload raw bytes, optionally tagged with a Content-Encoding (gzip, zstd).
+        
+        Args:
+            if_match: Only write if the object's current ETag matches
+            if_none_match: "*" to only write if the object does not exist
+            
+        Returns:
+            ETag of the written object
+            
+        Raises:
+            PreconditionFailedError: The condition did not hold (concurrent writer)
+        """
+        params = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "Body": body,
+            "ContentType": content_type,
+        }
+        if content_encoding:
+            params["ContentEncoding"] = content_encoding
+        if public:
+            params["ACL"] = "public-read"
+        conditions = {}
+        if self.conditional_writes and if_match:
+            conditions["IfMatch"] = if_match
+        if self.conditional_writes and if_none_match:
+            conditions["IfNoneMatch"] = if_none_match
+
+        try:
+            return self.client.put_object(**params, **conditions).get("ETag")
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in {"PreconditionFailed", "ConditionalRequestConflict", "412"}:
+                raise PreconditionFailedError(f"{key} changed since it was read ({code})") from e
+            if not conditions or code not in {"NotImplemented", "501"}:
+                raise
+            unsupported = e
+        except ParamValidationError as e:  # botocore too old for conditional writes
+            if not conditions:
+                raise
+            unsupported = e
+        logger.warning(f"Conditional writes not supported, writing unconditionally: {unsupported}")
+        self.conditional_writes = False
+        return self.client.put_object(**params).get("ETag")
+
     def upload_text(self, key: str, text: str, content_type: str = "text/plain", public: bool = True):
         """Upload a text object."""
         params = {
@@ -60,6 +168,23 @@ class SpacesClient:
         body = json.dumps(payload, indent=2)
         self.upload_text(key, body, content_type="application/json", public=public)
 
+    def list_keys(self, prefix: str) -> List[str]:
+        """List object keys under a prefix (all pages), sorted."""
+        keys = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return sorted(keys)
+
+    def delete_keys(self, keys: List[str]):
+        """Delete objects, up to 1000 per request."""
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+
     def append_text(self, key: str, text: str, content_type: str = "text/plain"):
         """Append text to existing file. Downloads current, appends, re-uploads."""
         current = self.download_text(key) or ""
@@ -0,0 +1,104 @@
+"""Serialize state payloads compactly, with optional compression and binary format."""
+
+import gzip
+import json
+import logging
+from typing import Any, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only needed for the *-zstd codecs
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency, only needed for the msgpack codecs
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Codec name -> (format, compression)
+CODECS = {
+    "json": ("json", None),
+    "json-gzip": ("json", "gzip"),
+    "json-zstd": ("json", "zstd"),
+    "msgpack": ("msgpack", None),
+    "msgpack-gzip": ("msgpack", "gzip"),
+    "msgpack-zstd": ("msgpack", "zstd"),
+}
+FALLBACK_CODEC = "json-gzip"  # Needs only the standard library
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_LEVEL = 1  # Level 6 saves ~7% more bytes for 3-4x the CPU; not worth it at upload speeds
+_ZSTD_LEVEL = 3
+
+_CONTENT_TYPES = {"json": "application/json", "msgpack": "application/msgpack"}
+
+
+def is_available(codec: str) -> bool:
+    """Check whether a codec's optional dependencies are installed."""
+    if codec not in CODECS:
+        return False
+    fmt, compression = CODECS[codec]
+    return (fmt != "msgpack" or msgpack is not None) and (compression != "zstd" or zstandard is not None)
+
+
+def resolve_codec(codec: str) -> str:
+    """Get codec, or FALLBACK_CODEC (with a warning) if it is unknown or not installed."""
+    if is_available(codec):
+        return codec
+    logger.warning(f"State codec {codec!r} unavailable (unknown or missing dependency), using {FALLBACK_CODEC}")
+    return FALLBACK_CODEC
+
+
+def encode(payload: Any, codec: str = FALLBACK_CODEC) -> Tuple[bytes, str, str]:
+    """
+    Serialize a payload.
+
+    Args:
+        payload: JSON-compatible object
+        codec: Name from CODECS (must be available)
+
+    Returns:
+        (body, content type, content encoding or "")
+    """
+    fmt, compression = CODECS[codec]
+    if fmt == "msgpack":
+        body = msgpack.packb(payload, use_bin_type=True)
+    else:
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    if compression == "gzip":
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+    elif compression == "zstd":
+        body = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(body)
+    return body, _CONTENT_TYPES[fmt], compression or ""
+
+
+def decode(body: bytes) -> Any:
+    """
+    Parse a payload written by any codec (or legacy indented JSON).
+
+    Compression is detected from the gzip/zstd magic bytes and the format
+    from the first byte: JSON text starts with whitespace or '{'/'[',
+    anything else is read as msgpack.
+
+    Args:
+        body: Raw object bytes
+
+    Returns:
+        Parsed payload
+    """
+    if body.startswith(_GZIP_MAGIC):
+        body = gzip.decompress(body)
+    elif body.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("State is zstd-compressed but the zstandard package is not installed")
+        body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+    if body[:1] in (b"{", b"[", b" ", b"\n", b"\r", b"\t") or body.startswith(b"\xef\xbb\xbf"):
+        return json.loads(body.decode("utf-8-sig"))
+    if msgpack is None:
+        raise RuntimeError("State is msgpack-encoded but the msgpack package is not installed")
+    return msgpack.unpackb(body, raw=False)
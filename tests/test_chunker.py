@@ -0,0 +1,52 @@
+"""Tests for structural Markdown chunking."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from openai_service.chunker import chunk_markdown, estimate_tokens, split_blocks
+
+
+def fence_lines(text):
+    return [line.strip() for line in text.split("\n") if line.lstrip().startswith("```")]
+
+
+def test_split_blocks_keeps_code_fence_whole():
+    markdown = "## Setup\n\n```bash\necho one\n\necho two\n```\n\nDone."
+    assert split_blocks(markdown) == ["## Setup", "```bash\necho one\n\necho two\n```", "Done."]
+
+
+def test_chunks_respect_budget():
+    markdown = "\n\n".join(f"## Step {i}\n\n" + "word " * 40 for i in range(20))
+    chunks = chunk_markdown(markdown, max_tokens=120, overlap=20)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 120 for chunk in chunks)
+
+
+def test_oversized_code_fence_is_balanced_in_every_chunk():
+    code = "\n".join(f"player.set_option('key_{i}', {i})" for i in range(200))
+    markdown = f"## Config\n\nRun this:\n\n```python\n{code}\n```\n\nThat's it."
+    chunks = chunk_markdown(markdown, max_tokens=200, overlap=0)
+
+    code_chunks = [chunk for chunk in chunks if "set_option" in chunk]
+    assert len(code_chunks) > 2
+    for chunk in chunks:
+        fences = fence_lines(chunk)
+        assert len(fences) % 2 == 0, chunk
+        # Every reopened piece keeps the language tag
+        assert fences[::2] == ["```python"] * (len(fences) // 2)
+        assert estimate_tokens(chunk) <= 200
+
+    # Every code line survives the split exactly once
+    body = "\n".join(chunks)
+    assert all(body.count(f"'key_{i}', {i})") == 1 for i in range(200))
+
+
+def test_oversized_code_fence_with_long_line_is_balanced():
+    markdown = "```\n" + "x = " + " + ".join(["value"] * 400) + "\n```"
+    chunks = chunk_markdown(markdown, max_tokens=150, overlap=0)
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert len(fence_lines(chunk)) % 2 == 0, chunk
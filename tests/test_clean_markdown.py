@@ -0,0 +1,46 @@
+"""Parity tests: clean_markdown against the previous multi-pass implementation."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src and scripts (parity baseline) to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from scraper.html_to_md import clean_markdown
+from check_clean_markdown import legacy_clean_markdown, fuzz_cases
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures" / "clean_markdown").glob("*.md"))
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.stem)
+def test_fixture_matches_legacy(path):
+    markdown = path.read_text(encoding="utf-8")
+    assert clean_markdown(markdown) == legacy_clean_markdown(markdown)
+
+
+def test_fixtures_exercise_every_rule():
+    corpus = "\n".join(path.read_text(encoding="utf-8") for path in FIXTURES)
+    assert "<!--" in corpus
+    assert "\n\n\n" in corpus
+    assert " \n" in corpus
+    for phrase in ("was this article helpful?", "related articles", "did you find it helpful?"):
+        assert phrase in corpus.lower()
+    # Non-ASCII letters that IGNORECASE folds to ASCII skip the fast pre-check
+    assert any(char in corpus for char in "İıſ")
+
+
+def test_boilerplate_is_removed():
+    markdown = (FIXTURES[0].parent / "pairing.md").read_text(encoding="utf-8")
+    cleaned = clean_markdown(markdown)
+    assert "Was this article helpful?" not in cleaned
+    assert "Related articles" not in cleaned
+    assert "\n\n\n" not in cleaned
+    assert "<!--" not in cleaned
+
+
+def test_fuzz_matches_legacy():
+    mismatches = [doc for doc in fuzz_cases(2000) if clean_markdown(doc) != legacy_clean_markdown(doc)]
+    assert not mismatches, mismatches[:3]
@@ -0,0 +1,54 @@
+"""Tests for the conversion cache and converter fingerprint invalidation."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import SKIP_TAGS, SKIP_CLASSES
+from scraper.conversion_cache import ConversionCache
+from scraper.html_to_md import CONVERTER_FINGERPRINT, converter_fingerprint
+from scraper.article_store import ArticleStore
+
+HTML = "<h2>Pair a screen</h2><p>Open <b>Settings</b>.</p><table><tr><td>cell</td></tr></table>"
+
+
+def test_cache_round_trip(tmp_path):
+    cache = ConversionCache(cache_dir=str(tmp_path))
+    key = ConversionCache.key(HTML, "https://support.optisigns.com")
+    assert cache.get(key) is None
+    cache.put(key, "## Pair a screen")
+    assert cache.get(key) == "## Pair a screen"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_fingerprint_tracks_skip_lists():
+    assert converter_fingerprint() == CONVERTER_FINGERPRINT
+    # Order does not matter, content does
+    assert converter_fingerprint(tuple(reversed(SKIP_TAGS)), SKIP_CLASSES) == CONVERTER_FINGERPRINT
+    assert converter_fingerprint(SKIP_TAGS + ("table",), SKIP_CLASSES) != CONVERTER_FINGERPRINT
+    assert converter_fingerprint(SKIP_TAGS, SKIP_CLASSES[1:]) != CONVERTER_FINGERPRINT
+
+
+def test_changing_skip_list_misses_cache(tmp_path):
+    cache = ConversionCache(cache_dir=str(tmp_path))
+    cache.put(ConversionCache.key(HTML), "cached under the current skip lists")
+
+    edited = converter_fingerprint(SKIP_TAGS + ("table",), SKIP_CLASSES)
+    assert cache.get(ConversionCache.key(HTML, fingerprint=edited)) is None
+    assert cache.get(ConversionCache.key(HTML)) == "cached under the current skip lists"
+
+
+def test_record_from_other_fingerprint_is_not_up_to_date(tmp_path):
+    store = ArticleStore(articles_dir=str(tmp_path / "articles"), state_file=str(tmp_path / "state.json"),
+                         use_spaces=False)
+    article = {"id": 1, "title": "Pair a screen", "html_url": "https://support.optisigns.com/hc/en-us/articles/1",
+               "updated_at": "2024-01-01T00:00:00Z", "edited_at": "2024-01-01T00:00:00Z"}
+    store.save_article(article, "## Pair a screen")
+    assert store.is_up_to_date(article)
+
+    record = store.get_article(1)
+    record["converter_version"] = converter_fingerprint(SKIP_TAGS + ("table",), SKIP_CLASSES)
+    store._put_record("1", record)
+    assert not store.is_up_to_date(article)
@@ -0,0 +1,46 @@
+"""Tests for one-shot and streamed HTML to Markdown conversion."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper.html_to_md import html_to_markdown, iter_html_to_markdown, write_markdown_stream
+
+ARTICLE = (
+    "<h2>Pair a screen</h2>\n\n\n<p>Open <b>Settings</b> and pick "
+    '<a href="/hc/en-us/articles/1">Pairing</a>.</p>'
+    "<ul><li>First</li><li>Second <code>code</code></li></ul>"
+    "<pre>line 1\n\n\n\nline 2</pre><p>Done.</p>\n\n"
+)
+BASE_URL = "https://support.optisigns.com"
+
+
+def split_every(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 16, len(ARTICLE)])
+def test_stream_matches_one_shot(size):
+    expected = html_to_markdown(ARTICLE, base_url=BASE_URL)
+    streamed = "".join(iter_html_to_markdown(split_every(ARTICLE, size), base_url=BASE_URL))
+    assert streamed == expected
+
+
+def test_write_markdown_stream(tmp_path):
+    path = tmp_path / "article.md"
+    written = write_markdown_stream(split_every(ARTICLE, 5), str(path), base_url=BASE_URL)
+    assert path.read_text(encoding="utf-8") == html_to_markdown(ARTICLE, base_url=BASE_URL)
+    assert written == len(path.read_text(encoding="utf-8"))
+
+
+def test_malformed_html_falls_back_only_in_one_shot():
+    html = "<p>Stray</a> end tag</p>"
+    # One-shot conversion returns the raw HTML...
+    assert html_to_markdown(html) == html
+    # ...while the stream has nothing to fall back to and raises
+    with pytest.raises(ValueError):
+        "".join(iter_html_to_markdown(split_every(html, 4)))
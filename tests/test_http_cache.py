@@ -0,0 +1,53 @@
+"""Tests for the on-disk HTTP cache and its size bound."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper.http_cache import HTTPCache
+
+URL = "https://support.optisigns.com/api/v2/help_center/en-us/articles/{}"
+
+
+def test_store_and_conditional_headers(tmp_path):
+    cache = HTTPCache(cache_dir=str(tmp_path))
+    cache.store(URL.format(1), etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT", body="{}")
+    entry = cache.get(URL.format(1))
+    assert entry["body"] == "{}"
+    assert HTTPCache.conditional_headers(entry) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_store_without_validators_is_skipped(tmp_path):
+    cache = HTTPCache(cache_dir=str(tmp_path))
+    cache.store(URL.format(1), etag=None, last_modified=None, body="{}")
+    assert cache.get(URL.format(1)) is None
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used(tmp_path):
+    cache = HTTPCache(cache_dir=str(tmp_path), max_bytes=20_000)
+    body = "x" * 1000
+    for i in range(15):
+        cache.store(URL.format(i), etag=f'"{i}"', last_modified=None, body=body)
+    # Entry i was last used i seconds after the oldest one
+    for i in range(15):
+        used = time.time() - 3600 + i
+        os.utime(cache._path(URL.format(i)), (used, used))
+    # Reading entry 0 makes it the most recently used
+    assert cache.get(URL.format(0)) is not None
+
+    for i in range(15, 25):
+        cache.store(URL.format(i), etag=f'"{i}"', last_modified=None, body=body)
+
+    size = sum(entry.stat().st_size for entry in os.scandir(tmp_path) if entry.name.endswith(".json"))
+    assert size <= 20_000
+    assert cache.stats()["http_cache_evicted"] > 0
+    assert cache.get(URL.format(0)) is not None
+    assert cache.get(URL.format(1)) is None
+    assert cache.get(URL.format(24)) is not None
@@ -0,0 +1,143 @@
+"""Tests for the staged worker pipeline."""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper.pipeline import Pipeline, Stage
+
+
+def jitter():
+    time.sleep(random.uniform(0, 0.003))
+
+
+def test_ordered_stage_sees_jobs_in_submission_order():
+    persisted = []
+
+    def fetch(job):
+        jitter()
+        job["fetched"] = True
+
+    pipeline = Pipeline([
+        Stage("fetch", fetch, workers=6),
+        Stage("convert", lambda jobs: [job.update(converted=True) for job in jobs], workers=2, batch_size=4),
+        Stage("persist", lambda job: persisted.append(job["id"]), ordered=True),
+    ], queue_size=4)
+    pipeline.run({"id": i} for i in range(100))
+
+    assert persisted == list(range(100))
+    stats = pipeline.stats()
+    assert stats["fetch"]["items"] == 100
+    assert stats["convert"]["items"] == 100
+    assert stats["persist"]["workers"] == 1
+
+
+def test_errors_skip_later_stages_but_reach_ordered_stage():
+    converted = []
+    persisted = []
+
+    def fetch(job):
+        jitter()
+        if job["id"] % 5 == 0:
+            raise ValueError(f"fetch failed for {job['id']}")
+
+    def convert(jobs):
+        converted.extend(job["id"] for job in jobs)
+
+    pipeline = Pipeline([
+        Stage("fetch", fetch, workers=4),
+        Stage("convert", convert, workers=2, batch_size=3),
+        Stage("persist", lambda job: persisted.append((job["id"], repr(job.get("error")))), ordered=True),
+    ], queue_size=2)
+    pipeline.run({"id": i} for i in range(30))
+
+    assert sorted(converted) == [i for i in range(30) if i % 5]
+    assert [job_id for job_id, _ in persisted] == list(range(30))
+    for job_id, error in persisted:
+        assert (error == f"ValueError('fetch failed for {job_id}')") == (job_id % 5 == 0)
+
+
+def test_batch_error_marks_every_job_in_the_batch():
+    persisted = []
+
+    def convert(jobs):
+        raise RuntimeError("pool broken")
+
+    pipeline = Pipeline([
+        Stage("convert", convert, workers=1, batch_size=4),
+        Stage("persist", lambda job: persisted.append(job), ordered=True),
+    ])
+    pipeline.run({"id": i} for i in range(10))
+
+    assert len(persisted) == 10
+    assert all(isinstance(job["error"], RuntimeError) for job in persisted)
+
+
+def test_queues_bound_jobs_in_flight():
+    lock = threading.Lock()
+    counts = {"fed": 0, "done": 0, "max_ahead": 0}
+    release = threading.Event()
+
+    def jobs():
+        for i in range(200):
+            with lock:
+                counts["fed"] += 1
+                counts["max_ahead"] = max(counts["max_ahead"], counts["fed"] - counts["done"])
+            yield {"id": i}
+
+    def persist(job):
+        release.wait()  # A stalled last stage must block the feeder
+        with lock:
+            counts["done"] += 1
+
+    pipeline = Pipeline([
+        Stage("fetch", lambda job: None, workers=2),
+        Stage("persist", persist, ordered=True),
+    ], queue_size=3)
+    runner = threading.Thread(target=pipeline.run, args=(jobs(),))
+    runner.start()
+    time.sleep(0.1)
+    with lock:
+        stalled_ahead = counts["fed"]
+    release.set()
+    runner.join(5)
+
+    assert not runner.is_alive()
+    assert counts["done"] == 200
+    # Two queues of 3 and three workers' jobs, plus the one being fed
+    assert stalled_ahead <= 2 * 3 + 3 + 1
+    assert counts["max_ahead"] <= 2 * 3 + 3 + 1
+
+
+def test_slow_job_does_not_grow_reorder_buffer():
+    lock = threading.Lock()
+    counts = {"fed": 0, "done": 0, "max_ahead": 0}
+
+    def jobs():
+        for i in range(100):
+            with lock:
+                counts["fed"] += 1
+                counts["max_ahead"] = max(counts["max_ahead"], counts["fed"] - counts["done"])
+            yield {"id": i}
+
+    def fetch(job):
+        if job["id"] == 0:
+            time.sleep(0.1)  # Holds back every later job at the ordered stage
+
+    def persist(job):
+        with lock:
+            counts["done"] += 1
+
+    pipeline = Pipeline([
+        Stage("fetch", fetch, workers=4),
+        Stage("persist", persist, ordered=True),
+    ], queue_size=2)
+    pipeline.run(jobs())
+
+    assert counts["done"] == 100
+    assert counts["max_ahead"] <= 2 * 2 + 5 + 1
@@ -0,0 +1,109 @@
+"""Tests for the adaptive (AIMD) rate limiter."""
+
+import sys
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper import rate_limiter
+from scraper.rate_limiter import AdaptiveLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    return clock
+
+
+def test_additive_increase_on_success():
+    limiter = AdaptiveLimiter(initial=4, max_limit=8)
+    limiter.on_success({})
+    assert limiter.limit == pytest.approx(4.25)
+    # About one slot per window of `limit` successes
+    for _ in range(4):
+        limiter.on_success({})
+    assert int(limiter.limit) == 5
+
+
+def test_growth_is_capped_at_max_limit():
+    limiter = AdaptiveLimiter(initial=2, max_limit=3)
+    for _ in range(50):
+        limiter.on_success({})
+    assert limiter.limit == 3
+
+
+def test_low_remaining_quota_halves_limit():
+    limiter = AdaptiveLimiter(initial=8, max_limit=16, low_watermark=10)
+    limiter.on_success({"X-Rate-Limit-Remaining": "50"})
+    assert limiter.limit > 8
+    limiter = AdaptiveLimiter(initial=8, max_limit=16, low_watermark=10)
+    limiter.on_success({"ratelimit-remaining": "10"})
+    assert limiter.limit == 4
+
+
+def test_throttle_halves_limit_down_to_minimum(clock):
+    limiter = AdaptiveLimiter(initial=8, min_limit=2, max_limit=16)
+    limiter.on_throttle({"Retry-After": "0"})
+    assert limiter.limit == 4
+    limiter.on_throttle({"Retry-After": "0"})
+    limiter.on_throttle({"Retry-After": "0"})
+    assert limiter.limit == 2
+    stats = limiter.stats()
+    assert stats["throttled"] == 3
+    assert (stats["min_concurrency"], stats["max_concurrency"]) == (2, 8)
+
+
+def test_retry_after_pauses_every_caller(clock):
+    limiter = AdaptiveLimiter(initial=4, max_limit=4)
+    assert limiter.on_throttle({"Retry-After": "5"}) == 5
+    assert not limiter.try_acquire()
+    clock.now += 4.9
+    assert not limiter.try_acquire()
+    clock.now += 0.1
+    assert limiter.try_acquire()
+    assert limiter.stats()["throttle_wait_seconds"] == 5
+
+
+def test_parse_retry_after():
+    assert AdaptiveLimiter.parse_retry_after("7") == 7
+    assert AdaptiveLimiter.parse_retry_after(None) == 1.0
+    assert AdaptiveLimiter.parse_retry_after("soon", default=3) == 3
+    assert AdaptiveLimiter.parse_retry_after("-4") == 0
+    http_date = formatdate(time.time() + 30, usegmt=True)
+    assert 25 <= AdaptiveLimiter.parse_retry_after(http_date) <= 30
+
+
+def test_slots_are_limited_and_released():
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    acquired = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)  # Blocked while both slots are taken
+    limiter.release()
+    assert acquired.wait(1)
+    thread.join()
+    assert limiter.in_flight == 2
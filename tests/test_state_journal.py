@@ -0,0 +1,193 @@
+"""Tests for Spaces state journaling: segment append, replay, compaction and concurrent writers."""
+
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config
+from scraper import article_store
+from scraper.article_store import ArticleStore
+from utils.spaces import PreconditionFailedError, SpacesClient
+
+
+def client_error(code: str, status: int) -> ClientError:
+    return ClientError({"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "op")
+
+
+class FakeS3:
+    """In-memory S3 client honouring IfMatch/IfNoneMatch on get and put."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def _etag(self, key):
+        return f'"{hashlib.md5(self.objects[key]).hexdigest()}"'
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        if Key not in self.objects:
+            raise client_error("NoSuchKey", 404)
+        if IfNoneMatch and IfNoneMatch == self._etag(Key):
+            raise client_error("304", 304)
+        body = self.objects[Key]
+        return {"Body": type("Body", (), {"read": lambda self: body})(), "ETag": self._etag(Key)}
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise client_error("404", 404)
+        return {"ETag": self._etag(Key)}
+
+    def put_object(self, Bucket, Key, Body, IfMatch=None, IfNoneMatch=None, **params):
+        if IfNoneMatch == "*" and Key in self.objects:
+            raise client_error("PreconditionFailed", 412)
+        if IfMatch and (Key not in self.objects or self._etag(Key) != IfMatch):
+            raise client_error("PreconditionFailed", 412)
+        self.objects[Key] = Body
+        return {"ETag": self._etag(Key)}
+
+    def get_paginator(self, name):
+        objects = self.objects
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                yield {"Contents": [{"Key": key} for key in sorted(objects) if key.startswith(Prefix)]}
+
+        return Paginator()
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    s3 = FakeS3()
+
+    def make_client():
+        client = SpacesClient.__new__(SpacesClient)
+        client.bucket = "test"
+        client.conditional_writes = True
+        client.client = s3
+        return client
+
+    monkeypatch.setattr(config, "SPACES_ENABLED", True)
+    monkeypatch.setattr(config, "SPACES_STATE_JOURNAL", True)
+    monkeypatch.setattr(config, "STATE_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "STATE_COMPACT_EVERY", 3)
+    monkeypatch.setattr(article_store, "SpacesClient", make_client)
+    return s3
+
+
+def open_store(tmp_path, name="a"):
+    return ArticleStore(articles_dir=str(tmp_path / name / "articles"),
+                        state_file=str(tmp_path / name / "state.json"), use_spaces=True)
+
+
+def save(store, article_id):
+    """Save one article and write state, as a run does when it ends."""
+    store.save_article({
+        "id": article_id,
+        "title": f"Article {article_id}",
+        "html_url": f"https://support.optisigns.com/hc/en-us/articles/{article_id}",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }, f"Body of article {article_id}")
+    store.flush()
+
+
+def segments(s3):
+    return sorted(key for key in s3.objects if key.startswith(config.SPACES_STATE_JOURNAL_PREFIX))
+
+
+def test_first_save_writes_snapshot_then_segments(s3, tmp_path):
+    store = open_store(tmp_path)
+    save(store, 1)
+    assert config.SPACES_STATE_KEY in s3.objects
+    assert segments(s3) == []
+
+    save(store, 2)
+    store.set_vector_store_id("vs_1")
+    assert segments(s3) == [f"{config.SPACES_STATE_JOURNAL_PREFIX}{seq:010d}.json" for seq in (2, 3)]
+
+
+def test_segments_replay_on_load(s3, tmp_path):
+    store = open_store(tmp_path)
+    save(store, 1)
+    save(store, 2)
+    store.set_vector_store_id("vs_1")
+
+    reloaded = open_store(tmp_path, "b")
+    assert reloaded.get_article(1)["title"] == "Article 1"
+    assert reloaded.get_article(2)["title"] == "Article 2"
+    assert reloaded.get_vector_store_id() == "vs_1"
+    assert reloaded._journal_seq == 3
+
+
+def test_compaction_folds_segments_into_snapshot(s3, tmp_path):
+    store = open_store(tmp_path)
+    for article_id in range(1, 5):
+        save(store, article_id)  # Snapshot, then segments 2-4
+    assert len(segments(s3)) == 3
+
+    save(store, 5)  # STATE_COMPACT_EVERY segments since the snapshot: compact
+    assert segments(s3) == []
+    reloaded = open_store(tmp_path, "b")
+    assert reloaded._journal_seq == 5
+    assert [reloaded.get_article(i)["title"] for i in range(1, 6)] == [f"Article {i}" for i in range(1, 6)]
+
+    save(store, 6)  # Journaling resumes after the new snapshot
+    assert segments(s3) == [f"{config.SPACES_STATE_JOURNAL_PREFIX}{6:010d}.json"]
+    assert open_store(tmp_path, "c").get_article(6) is not None
+
+
+def test_stale_segments_are_skipped_on_load(s3, tmp_path):
+    store = open_store(tmp_path)
+    save(store, 1)
+    store.set_vector_store_id("vs_old")  # Segment 2
+    leftover = {key: s3.objects[key] for key in segments(s3)}
+    store.set_vector_store_id("vs_new")  # Segment 3
+    save(store, 4)
+    save(store, 5)  # Compacts into a snapshot at journal_seq 5
+    # A cleanup that failed leaves segments the snapshot already covers
+    s3.objects.update(leftover)
+
+    reloaded = open_store(tmp_path, "b")
+    assert reloaded.get_vector_store_id() == "vs_new"
+    assert reloaded._journal_seq == 5
+
+
+def test_concurrent_segment_writer_is_refused(s3, tmp_path):
+    first = open_store(tmp_path)
+    save(first, 1)
+    second = open_store(tmp_path, "b")
+
+    save(first, 2)  # Writes segment 2
+    with pytest.raises(PreconditionFailedError):
+        save(second, 3)  # Would write segment 2 as well
+    assert open_store(tmp_path, "c").get_article(3) is None
+
+
+def test_writer_is_refused_after_snapshot_replaced(s3, tmp_path):
+    first = open_store(tmp_path)
+    save(first, 1)
+    second = open_store(tmp_path, "b")
+
+    for article_id in range(2, 6):
+        save(first, article_id)  # Ends in a compaction, replacing the snapshot
+    with pytest.raises(PreconditionFailedError):
+        save(second, 6)
+
+
+def test_snapshot_write_requires_loaded_etag(s3, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "SPACES_STATE_JOURNAL", False)
+    first = open_store(tmp_path)
+    save(first, 1)
+    second = open_store(tmp_path, "b")
+
+    save(first, 2)
+    with pytest.raises(PreconditionFailedError):
+        save(second, 3)